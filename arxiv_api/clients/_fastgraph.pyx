@@ -0,0 +1,290 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+from cpython.array cimport array, clone
+from libc.string cimport memset
+
+"""
+      |
+  \  ___  /                           _________
+ _  /   \  _    GÉANT                 |  * *  | Co-Funded by
+    | ~ |       Trust & Identity      | *   * | the European
+     \_/        Incubator             |__*_*__| Union
+      =
+"""
+
+# Optional compiled versions of the CSR kernels of collaboration_index. They take and return the
+# same values as the pure-Python functions there, which are used whenever this module is not built:
+#
+#     cythonize -i arxiv_api/clients/_fastgraph.pyx
+
+cdef array INT_ARRAY = array('i')
+
+
+cdef array _unreached(Py_ssize_t n):
+    """
+    Allocate an integer array of length n with every element set to -1 (all bits set).
+
+    Parameters:
+        n (Py_ssize_t): Length of the array.
+
+    Returns:
+        array: The new array('i').
+    """
+    cdef array out = clone(INT_ARRAY, n, False)
+    memset(out.data.as_voidptr, 0xff, n * sizeof(int))
+    return out
+
+
+cdef int _expand_layer(const int[:] indptr, const int[:] indices, const int[:] degree, int[:] frontier, int size,
+                       int[:] next_frontier, int* next_size, long long* next_cost, int[:] pred, int[:] other_pred):
+    """
+    Expand one BFS layer for one side of bidirectional_bfs.
+
+    Parameters:
+        indptr, indices, degree: CSR arrays and node degrees.
+        frontier (int[:]): Buffer whose first size entries are the current layer of this side.
+        size (int): Number of nodes in the current layer.
+        next_frontier (int[:]): Buffer receiving the next layer.
+        next_size (int*): Receives the number of nodes in the next layer.
+        next_cost (long long*): Receives the degree sum of the next layer.
+        pred (int[:]): Predecessor ids of this side, updated in place (-1 for not reached).
+        other_pred (int[:]): Predecessor ids of the opposite side.
+
+    Returns:
+        int: Id of the meeting node, or -1 if the two searches have not met yet.
+    """
+    cdef int count = 0
+    cdef long long cost = 0
+    cdef int i, j, node, neighbor
+
+    for i in range(size):
+        node = frontier[i]
+
+        for j in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[j]
+
+            if pred[neighbor] == -1:
+                pred[neighbor] = node
+
+                if other_pred[neighbor] != -1:
+                    next_size[0] = count
+                    next_cost[0] = cost
+                    return neighbor
+
+                next_frontier[count] = neighbor
+                cost += degree[neighbor]
+                count += 1
+
+    next_size[0] = count
+    next_cost[0] = cost
+    return -1
+
+
+cdef int _expand_layer_length(const int[:] indptr, const int[:] indices, const int[:] degree, int[:] frontier,
+                              int size, int depth, int[:] next_frontier, int* next_size, long long* next_cost,
+                              int[:] dist, int[:] other_dist):
+    """
+    Expand one BFS layer for one side of bidirectional_bfs_length.
+
+    Parameters:
+        As for _expand_layer, with depth (int) being the depth of the layer being reached and
+        dist / other_dist holding the depths reached by each side instead of predecessors.
+
+    Returns:
+        int: Length of the path through the meeting node, or -1 if the searches have not met yet.
+    """
+    cdef int count = 0
+    cdef long long cost = 0
+    cdef int i, j, node, neighbor
+
+    for i in range(size):
+        node = frontier[i]
+
+        for j in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[j]
+
+            if dist[neighbor] == -1:
+                dist[neighbor] = depth
+
+                if other_dist[neighbor] != -1:
+                    next_size[0] = count
+                    next_cost[0] = cost
+                    return depth + other_dist[neighbor]
+
+                next_frontier[count] = neighbor
+                cost += degree[neighbor]
+                count += 1
+
+    next_size[0] = count
+    next_cost[0] = cost
+    return -1
+
+
+def bidirectional_bfs(const int[:] indptr, const int[:] indices, const int[:] degree, int src, int dst):
+    """
+    Compiled collaboration_index.bidirectional_bfs.
+
+    Parameters:
+        indptr (array): CSR offsets; the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): Concatenated neighbour ids of all nodes.
+        degree (array): Number of neighbours per node.
+        src (int): Id of the start node.
+        dst (int): Id of the target node.
+
+    Returns:
+        Optional[List[int]]: Node ids along a shortest path from src to dst (inclusive),
+                            or None if dst is unreachable from src.
+    """
+    if src == dst:
+        return [src]
+
+    cdef Py_ssize_t n = indptr.shape[0] - 1
+    cdef int[:] pred_fwd = _unreached(n)
+    cdef int[:] pred_bwd = _unreached(n)
+    cdef int[:] frontier_fwd = clone(INT_ARRAY, n, False)
+    cdef int[:] frontier_bwd = clone(INT_ARRAY, n, False)
+    cdef int[:] spare = clone(INT_ARRAY, n, False)
+    cdef int[:] swap
+    cdef int size_fwd = 1, size_bwd = 1, next_size = 0, meet = -1, node
+    cdef long long cost_fwd = degree[src], cost_bwd = degree[dst], next_cost = 0
+
+    pred_fwd[src] = src
+    pred_bwd[dst] = dst
+    frontier_fwd[0] = src
+    frontier_bwd[0] = dst
+
+    while size_fwd > 0 and size_bwd > 0:
+        if cost_fwd <= cost_bwd:
+            meet = _expand_layer(indptr, indices, degree, frontier_fwd, size_fwd, spare, &next_size, &next_cost,
+                                 pred_fwd, pred_bwd)
+            swap = frontier_fwd
+            frontier_fwd = spare
+            spare = swap
+            size_fwd = next_size
+            cost_fwd = next_cost
+        else:
+            meet = _expand_layer(indptr, indices, degree, frontier_bwd, size_bwd, spare, &next_size, &next_cost,
+                                 pred_bwd, pred_fwd)
+            swap = frontier_bwd
+            frontier_bwd = spare
+            spare = swap
+            size_bwd = next_size
+            cost_bwd = next_cost
+
+        if meet != -1:
+            path = [meet]
+            node = meet
+            while node != src:
+                node = pred_fwd[node]
+                path.append(node)
+            path.reverse()
+
+            node = meet
+            while node != dst:
+                node = pred_bwd[node]
+                path.append(node)
+
+            return path
+
+    return None
+
+
+def bidirectional_bfs_length(const int[:] indptr, const int[:] indices, const int[:] degree, int src, int dst):
+    """
+    Compiled collaboration_index.bidirectional_bfs_length.
+
+    Parameters:
+        indptr (array): CSR offsets; the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): Concatenated neighbour ids of all nodes.
+        degree (array): Number of neighbours per node.
+        src (int): Id of the start node.
+        dst (int): Id of the target node.
+
+    Returns:
+        Optional[int]: Number of edges on a shortest path from src to dst,
+                      or None if dst is unreachable from src.
+    """
+    if src == dst:
+        return 0
+
+    cdef Py_ssize_t n = indptr.shape[0] - 1
+    cdef int[:] dist_fwd = _unreached(n)
+    cdef int[:] dist_bwd = _unreached(n)
+    cdef int[:] frontier_fwd = clone(INT_ARRAY, n, False)
+    cdef int[:] frontier_bwd = clone(INT_ARRAY, n, False)
+    cdef int[:] spare = clone(INT_ARRAY, n, False)
+    cdef int[:] swap
+    cdef int size_fwd = 1, size_bwd = 1, next_size = 0, length = -1, depth_fwd = 0, depth_bwd = 0
+    cdef long long cost_fwd = degree[src], cost_bwd = degree[dst], next_cost = 0
+
+    dist_fwd[src] = 0
+    dist_bwd[dst] = 0
+    frontier_fwd[0] = src
+    frontier_bwd[0] = dst
+
+    while size_fwd > 0 and size_bwd > 0:
+        if cost_fwd <= cost_bwd:
+            depth_fwd += 1
+            length = _expand_layer_length(indptr, indices, degree, frontier_fwd, size_fwd, depth_fwd, spare,
+                                          &next_size, &next_cost, dist_fwd, dist_bwd)
+            swap = frontier_fwd
+            frontier_fwd = spare
+            spare = swap
+            size_fwd = next_size
+            cost_fwd = next_cost
+        else:
+            depth_bwd += 1
+            length = _expand_layer_length(indptr, indices, degree, frontier_bwd, size_bwd, depth_bwd, spare,
+                                          &next_size, &next_cost, dist_bwd, dist_fwd)
+            swap = frontier_bwd
+            frontier_bwd = spare
+            spare = swap
+            size_bwd = next_size
+            cost_bwd = next_cost
+
+        if length != -1:
+            return length
+
+    return None
+
+
+def connected_components(const int[:] indptr, const int[:] indices):
+    """
+    Compiled collaboration_index.connected_components.
+
+    Parameters:
+        indptr (array): CSR offsets; the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): Concatenated neighbour ids of all nodes.
+
+    Returns:
+        array: Component id per node; two nodes are connected exactly when their ids are equal.
+    """
+    cdef Py_ssize_t n = indptr.shape[0] - 1
+    cdef array component = _unreached(n)
+    cdef int[:] label = component
+    cdef int[:] stack = clone(INT_ARRAY, n, False)
+    cdef int top, node, neighbor, j, next_component = 0
+    cdef Py_ssize_t root
+
+    for root in range(n):
+        if label[root] != -1:
+            continue
+
+        label[root] = next_component
+        stack[0] = <int> root
+        top = 1
+
+        while top > 0:
+            top -= 1
+            node = stack[top]
+
+            for j in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[j]
+
+                if label[neighbor] == -1:
+                    label[neighbor] = next_component
+                    stack[top] = neighbor
+                    top += 1
+
+        next_component += 1
+
+    return component
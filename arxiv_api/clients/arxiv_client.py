@@ -1,8 +1,18 @@
-from arxiv import Result
-from typing import List
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 from unidecode import unidecode
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from xml.etree import ElementTree
 
-import arxiv
+import functools
+import os
+import random
+import re
+import requests
+import shelve
+import sys
+import threading
+import time
 
 """
       |   
@@ -13,29 +23,256 @@ import arxiv
       =
 """
 
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
+OPENSEARCH_NAMESPACE = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+# Cache key prefix of OR-combined batch searches, kept apart from single-author searches.
+BATCH_CACHE_NAMESPACE = "batch:"
+
+
+def _transliterate(name: str) -> str:
+    """
+    Convert special characters of an author name to ASCII equivalents.
+
+    Pure-ASCII names are returned unchanged without a table lookup; other names go through
+    the memoised _unidecode_cached.
+
+    Parameters:
+        name (str): The author name to transliterate.
+
+    Returns:
+        str: The ASCII transliteration of the name.
+    """
+    if name.isascii():
+        return name
+    return _unidecode_cached(name)
+
+
+@functools.lru_cache(maxsize=10_000)
+def _unidecode_cached(name: str) -> str:
+    """
+    Transliterate a non-ASCII author name with unidecode, memoising repeated names.
+
+    Parameters:
+        name (str): The author name to transliterate.
+
+    Returns:
+        str: The interned ASCII transliteration of the name.
+    """
+    return sys.intern(unidecode(name))
+
+
+class Publication(NamedTuple):
+    """
+    A lightweight publication record holding only the ArXiv metadata used by this project.
+    """
+    title: str
+    authors: List[str]
+    year: int
+    categories: List[str]
+    entry_id: str
+
+
+class PoliteRetry(Retry):
+    """
+    A urllib3 Retry that adds a random jitter to every backoff between attempts and sends each
+    retry through the same politeness gate as first attempts.
+
+    urllib3 only offers backoff_jitter from version 2.0 on; adding the jitter here keeps the
+    client working with the urllib3 1.26 releases that requests still accepts. Retries happen
+    inside HTTPAdapter.send, below RateLimitedHTTPAdapter's own wait, so without the gate a
+    failed request would be retried right away (urllib3 2.x does not back off before the first
+    retry at all).
+    """
+
+    def __init__(self, *args, jitter_seconds: float = 0.0, wait_for_slot=None, **kwargs):
+        """
+        Initialize the PoliteRetry.
+
+        Parameters:
+            *args: Positional options forwarded to Retry.
+            jitter_seconds (float): Upper bound of the random delay added to each backoff (default: 0.0).
+            wait_for_slot (callable): Called after each backoff and blocks until the next request
+                                     may be sent (default: None, no gate).
+            **kwargs: Options forwarded to Retry.
+
+        Returns:
+            None
+        """
+        super().__init__(*args, **kwargs)
+        self.jitter_seconds = jitter_seconds
+        self.wait_for_slot = wait_for_slot
+
+    def new(self, **kwargs):
+        """
+        Return a copy with updated counters, as Retry.new does, keeping the jitter and the gate.
+
+        Parameters:
+            **kwargs: Options overriding those of this Retry.
+
+        Returns:
+            PoliteRetry: The new Retry object.
+        """
+        kwargs.setdefault("jitter_seconds", self.jitter_seconds)
+        kwargs.setdefault("wait_for_slot", self.wait_for_slot)
+        return super().new(**kwargs)
+
+    def sleep(self, response=None) -> None:
+        """
+        Sleep for the backoff or Retry-After delay, then wait for a free request slot.
+
+        Parameters:
+            response (urllib3.response.HTTPResponse): The response that triggered the retry, if any.
+
+        Returns:
+            None
+        """
+        super().sleep(response)
+
+        if self.wait_for_slot is not None:
+            self.wait_for_slot()
+
+    def get_backoff_time(self) -> float:
+        """
+        Return the exponential backoff computed by Retry plus a random jitter.
+
+        Parameters:
+            None
+
+        Returns:
+            float: Number of seconds to sleep before the next attempt.
+        """
+        return super().get_backoff_time() + random.uniform(0, self.jitter_seconds)
+
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that spaces every outgoing request by a politeness delay shared across threads.
+    """
+
+    def __init__(self, delay_seconds: float = 3.0, max_jitter_seconds: float = 1.0, **kwargs):
+        """
+        Initialize the RateLimitedHTTPAdapter.
+
+        Parameters:
+            delay_seconds (float): Minimum delay between the start of consecutive requests (default: 3.0).
+            max_jitter_seconds (float): Upper bound of the random delay added on top of
+                                       delay_seconds (default: 1.0).
+            **kwargs: Connection pool options forwarded to HTTPAdapter. A PoliteRetry passed as
+                     max_retries is bound to this adapter's politeness gate.
+
+        Returns:
+            None
+        """
+        super().__init__(**kwargs)
+        self.delay_seconds = delay_seconds
+        self.max_jitter_seconds = max_jitter_seconds
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+
+        if isinstance(self.max_retries, PoliteRetry):
+            self.max_retries = self.max_retries.new(wait_for_slot=self._wait_for_request_slot)
+
+    def send(self, request, **kwargs):
+        """
+        Wait for a free request slot, then send the request through the connection pool.
+
+        Parameters:
+            request (requests.PreparedRequest): The request to send.
+            **kwargs: Options forwarded to HTTPAdapter.send.
+
+        Returns:
+            requests.Response: The response returned by HTTPAdapter.send.
+        """
+        self._wait_for_request_slot()
+        return super().send(request, **kwargs)
+
+    def _wait_for_request_slot(self) -> None:
+        """
+        Block until the politeness delay since the previously scheduled request has elapsed.
+
+        Slots are reserved under a lock, so concurrent callers are spaced at least
+        delay_seconds (plus random jitter) apart without holding the lock while sleeping.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time)
+            self._next_request_time = request_time + self.delay_seconds + random.uniform(0, self.max_jitter_seconds)
+
+        if request_time > now:
+            time.sleep(request_time - now)
+
 
 class ArxivClient:
     """
     A client for searching academic publications from the ArXiv repository using author-based queries.
     """
 
-    def __init__(self):
+    def __init__(self, page_size: int = 1000, delay_seconds: float = 3.0, num_retries: int = 5,
+                 max_jitter_seconds: float = 1.0, cache_path: str = "../cache_database/publications",
+                 memory_cache_size: int = 10_000, pool_connections: int = 50, pool_maxsize: int = 100,
+                 backoff_factor: float = 0.5, cache_max_age: float = 7 * 24 * 3600):
         """
-        Initialize the ArxivClient.
+        Initialize the ArxivClient with a single pooled HTTP session reused across all searches,
+        so consecutive queries share TCP/TLS connections instead of opening new ones.
 
         Parameters:
-            None
+            page_size (int): Maximum number of results fetched per API request (default: 1000).
+            delay_seconds (float): Politeness delay between the start of consecutive API requests
+                                  (default: 3.0). Enforced across threads by the session's adapter.
+            num_retries (int): Number of retries for failed API requests (default: 5). Connection
+                              errors and 429/5xx responses are retried with exponential backoff,
+                              honouring the server's Retry-After header.
+            max_jitter_seconds (float): Upper bound of the random delay added on top of
+                                       delay_seconds and of each retry backoff (default: 1.0).
+            cache_path (str): Path of the on-disk publication cache shared across runs
+                             (default: "../cache_database/publications"). None disables it.
+            memory_cache_size (int): Number of searches kept in the in-process LRU cache
+                                    (default: 10000).
+            pool_connections (int): Number of connection pools to cache (default: 50).
+            pool_maxsize (int): Maximum number of connections kept alive per pool (default: 100).
+            backoff_factor (float): Base of the exponential backoff between retries (default: 0.5).
+            cache_max_age (float): Age in seconds after which a search stored in the on-disk cache
+                                  is fetched again, so new publications show up (default: one week).
+                                  None keeps cached searches forever.
 
         Returns:
             None
         """
-        pass
+        self.page_size = page_size
 
-    @staticmethod
-    def search_arxiv_publications(author_name: str, max_results: int = 50, transliterate_name: bool = True) -> List[
-        Result]:
+        retry = PoliteRetry(total=num_retries, backoff_factor=backoff_factor, jitter_seconds=max_jitter_seconds,
+                            status_forcelist=[429, 500, 502, 503, 504], respect_retry_after_header=True,
+                            raise_on_status=False)
+        adapter = RateLimitedHTTPAdapter(delay_seconds=delay_seconds, max_jitter_seconds=max_jitter_seconds,
+                                         pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                         max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self.cache_path = cache_path
+        self.cache_max_age = cache_max_age
+        self._cache_lock = threading.Lock()
+        self._cached_search = functools.lru_cache(maxsize=memory_cache_size)(self._search_with_disk_cache)
+
+        if cache_path is not None:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+
+    def search_arxiv_publications(self, author_name: str, max_results: int = 50,
+                                  transliterate_name: bool = True) -> List[Publication]:
         """
         Search for publications on ArXiv by author name using the repository's search interface.
+        Safe to call from multiple threads; requests are spaced by the client's politeness delay.
+        Results are served from the in-process and on-disk caches when the author was searched before.
 
         Parameters:
             author_name (str): The full name of the author to search for.
@@ -46,37 +283,250 @@ class ArxivClient:
                                      for improved search compatibility (default: True).
 
         Returns:
-            List[Result]: List of arxiv.Result objects containing publication metadata such as:
+            List[Publication]: List of Publication records containing publication metadata such as:
                          - title: Publication title
-                         - authors: List of all authors
-                         - published: Publication date
+                         - authors: List of all author names
+                         - year: Publication year
                          - categories: ArXiv subject categories
                          - entry_id: Unique ArXiv identifier and URL
                          Returns empty list if no publications found or search fails.
         """
         if transliterate_name:
-            author_name = unidecode(author_name)
+            author_name = _transliterate(author_name)
+
+        return list(self._cached_search(author_name, max_results))
+
+    def search_arxiv_publications_batch(self, author_names: List[str], max_results: int = 50,
+                                        transliterate_name: bool = True,
+                                        batch_size: int = 20) -> Dict[str, List[Publication]]:
+        """
+        Search for the publications of several authors with one OR-combined ArXiv query per batch.
+
+        Authors already present in the on-disk cache are not queried again. Each batch requests
+        up to max_results publications per author, and every returned publication is assigned to
+        the batch authors whose (transliterated, case-insensitive) name appears in its author list.
+        An author falls back to search_arxiv_publications when the batch cannot vouch for their
+        results: when no publication matched their name exactly (e.g. "Y. Bengio" versus the
+        name recorded on ArXiv), or when the shared batch limit was reached before the author got
+        max_results publications. Batches of a single author, such as the start of a network
+        exploration, are always searched individually.
+
+        Batch results are cached under their own keys, separate from those of
+        search_arxiv_publications, since they only hold exact name matches.
+
+        Parameters:
+            author_names (List[str]): The full names of the authors to search for.
+            max_results (int): Maximum number of results per author (default: 50).
+            transliterate_name (bool): Whether to convert special characters to ASCII equivalents
+                                     for improved search compatibility (default: True).
+            batch_size (int): Maximum number of authors combined into one query (default: 20).
+
+        Returns:
+            Dict[str, List[Publication]]: Mapping from each requested author name to its list of
+                                         Publication records (empty list if none were found).
+        """
+        query_names = {name: _transliterate(name) if transliterate_name else name for name in author_names}
+        publications = {}
+        missing = []
+
+        searches = [(query_name, max_results) for query_name in query_names.values()]
+        cached = self._read_cache(searches)
+        cached_batch = self._read_cache(searches, namespace=BATCH_CACHE_NAMESPACE)
+
+        for name, query_name in query_names.items():
+            if (query_name, max_results) in cached:
+                publications[name] = list(cached[(query_name, max_results)])
+            elif (query_name, max_results) in cached_batch:
+                publications[name] = list(cached_batch[(query_name, max_results)])
+            else:
+                missing.append(name)
+
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            individual = []
+
+            if len(batch) == 1:
+                individual = batch
+            else:
+                limit = max_results * len(batch)
+                fetched = list(self._iter_publications([query_names[name] for name in batch], limit))
+                fetched_authors = [{_transliterate(author).lower() for author in publication.authors}
+                                   for publication in fetched]
+                truncated = len(fetched) >= limit
+                found = {}
+
+                for name in batch:
+                    normalized_name = _transliterate(query_names[name]).lower()
+                    matched = tuple(publication for publication, authors in zip(fetched, fetched_authors)
+                                    if normalized_name in authors)[:max_results]
+
+                    # Results are sorted by date, so a truncated batch still holds an author's most
+                    # recent papers, but only the authors who got a full page are known complete.
+                    if matched and (not truncated or len(matched) == max_results):
+                        found[(query_names[name], max_results)] = matched
+                        publications[name] = list(matched)
+                    else:
+                        individual.append(name)
+
+                self._write_cache(found, namespace=BATCH_CACHE_NAMESPACE)
+
+            for name in individual:
+                publications[name] = self.search_arxiv_publications(query_names[name], max_results,
+                                                                    transliterate_name=False)
+
+        return publications
+
+    def _search_with_disk_cache(self, author_name: str, max_results: int) -> tuple:
+        """
+        Look up a search in the on-disk cache and query ArXiv only on a cache miss.
+
+        Parameters:
+            author_name (str): The author name exactly as it is sent to ArXiv.
+            max_results (int): Maximum number of results to return.
+
+        Returns:
+            tuple: Tuple of Publication records, stored back to disk after a cache miss.
+        """
+        cached = self._read_cache([(author_name, max_results)])
+
+        if (author_name, max_results) in cached:
+            return cached[(author_name, max_results)]
+
+        publications = tuple(self._iter_publications([author_name], max_results))
+        self._write_cache({(author_name, max_results): publications})
+        return publications
 
-        search_query = f"au:\"{author_name}\""
+    def _read_cache(self, searches: List[Tuple[str, int]], namespace: str = "") -> Dict[Tuple[str, int], tuple]:
+        """
+        Read previously stored searches from the on-disk cache, skipping those older than
+        cache_max_age.
+
+        Parameters:
+            searches (List[Tuple[str, int]]): (author name, max_results) pairs to look up.
+            namespace (str): Prefix separating kinds of searches in the cache (default: "",
+                            single-author searches).
+
+        Returns:
+            Dict[Tuple[str, int], tuple]: The cached Publication tuples of the searches that were found
+                                         and are still fresh.
+        """
+        if self.cache_path is None:
+            return {}
+
+        found = {}
+        oldest = time.time() - self.cache_max_age if self.cache_max_age is not None else None
+
+        with self._cache_lock:
+            with shelve.open(self.cache_path) as cache:
+                for author_name, max_results in searches:
+                    entry = cache.get(f"{namespace}{max_results}:{author_name.lower()}")
+
+                    # Entries are (fetch time, records); anything else predates the timestamps.
+                    if not isinstance(entry, tuple):
+                        continue
+
+                    fetched_at, records = entry
+
+                    if oldest is None or fetched_at >= oldest:
+                        found[(author_name, max_results)] = tuple(Publication(*record) for record in records)
+
+        return found
+
+    def _write_cache(self, publications: Dict[Tuple[str, int], tuple], namespace: str = "") -> None:
+        """
+        Store searches in the on-disk cache as plain tuples, stamped with the current time.
+
+        Parameters:
+            publications (Dict[Tuple[str, int], tuple]): Publication tuples keyed by
+                                                        (author name, max_results).
+            namespace (str): Prefix separating kinds of searches in the cache (default: "",
+                            single-author searches).
+
+        Returns:
+            None
+        """
+        if self.cache_path is None:
+            return
+
+        fetched_at = time.time()
+
+        with self._cache_lock:
+            with shelve.open(self.cache_path) as cache:
+                for (author_name, max_results), records in publications.items():
+                    cache[f"{namespace}{max_results}:{author_name.lower()}"] = (
+                        fetched_at, [tuple(record) for record in records])
+
+    def _iter_publications(self, author_names: List[str], max_results: int) -> Iterator[Publication]:
+        """
+        Lazily query the ArXiv API for the most recent publications of one or more authors.
+
+        Each request asks for no more results than are still needed, and the next page is only
+        requested once the consumer has iterated past the current one, so stopping early
+        never triggers further requests.
+
+        Parameters:
+            author_names (List[str]): The author names exactly as they are sent to ArXiv;
+                                     several names are combined with OR.
+            max_results (int): Maximum number of results to yield.
+
+        Yields:
+            Publication: Publication records parsed from the returned Atom feed pages.
+        """
+        search_query = " OR ".join(f"au:\"{author_name}\"" for author_name in author_names)
+        fetched = 0
+
+        while fetched < max_results:
+            response = self._session.get(ARXIV_API_URL, params={
+                "search_query": search_query,
+                "start": fetched,
+                "max_results": min(self.page_size, max_results - fetched),
+                "sortBy": "submittedDate",
+                "sortOrder": "descending"
+            })
+            response.raise_for_status()
+
+            page, total_results = self._parse_feed(response.content)
+            page = page[:max_results - fetched]
+            fetched += len(page)
+            yield from page
+
+            if not page or fetched >= total_results:
+                break
+
+    @staticmethod
+    def _parse_feed(content: bytes) -> Tuple[List[Publication], int]:
+        """
+        Parse an ArXiv Atom feed, extracting only the fields stored in Publication records.
+
+        Parameters:
+            content (bytes): Raw XML body of an ArXiv API response.
+
+        Returns:
+            Tuple[List[Publication], int]: The publications of this page and the total number
+                                          of results reported by the feed.
+        """
+        root = ElementTree.fromstring(content)
+        total_results = int(root.findtext(f"{OPENSEARCH_NAMESPACE}totalResults", default="0"))
+        publications = []
 
-        search = arxiv.Search(
-            query=search_query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending
-        )
+        for entry in root.iter(f"{ATOM_NAMESPACE}entry"):
+            publications.append(Publication(
+                title=re.sub(r"\s+", " ", entry.findtext(f"{ATOM_NAMESPACE}title", default="")).strip(),
+                authors=[name.text for name in entry.iterfind(f"{ATOM_NAMESPACE}author/{ATOM_NAMESPACE}name")],
+                year=int(entry.findtext(f"{ATOM_NAMESPACE}published", default="0")[:4]),
+                categories=[category.get("term") for category in entry.iterfind(f"{ATOM_NAMESPACE}category")],
+                entry_id=entry.findtext(f"{ATOM_NAMESPACE}id", default="")
+            ))
 
-        client = arxiv.Client()
-        results = list(client.results(search))
-        return results
+        return publications, total_results
 
     @staticmethod
-    def display_publication_info(results: List[Result]) -> None:
+    def display_publication_info(results: List[Publication]) -> None:
         """
         Display formatted publication information to console output.
 
         Parameters:
-            results (List[Result]): List of arxiv.Result objects from search_arxiv_publications.
+            results (List[Publication]): List of Publication records from search_arxiv_publications.
                                    Can be empty list for graceful handling.
 
         Returns:
@@ -92,9 +542,9 @@ class ArxivClient:
         print("-" * 80)
 
         for i, result in enumerate(results, 1):
-            pub_year = result.published.year
+            pub_year = result.year
             categories = ", ".join(result.categories)
-            authors = ", ".join(author.name for author in result.authors)
+            authors = ", ".join(result.authors)
 
             print(f"Publication #{i}:")
             print(f"Title: {result.title}")
@@ -110,12 +560,13 @@ class ArxivClient:
         Extract all author names from a publication result for collaboration network analysis.
 
         Parameters:
-            result (arxiv.Result): A single publication result object from ArXiv search.
+            result (Publication): A single publication record from ArXiv search.
                                   Must contain valid authors list attribute.
 
         Returns:
             list: List of author name strings including the primary author and all collaborators.
-                 Names are returned as provided in the ArXiv metadata without modification.
+                 Names are returned as provided in the ArXiv metadata without modification,
+                 interned so that every occurrence of an author shares a single string object.
                  Returns empty list if no authors found in the result.
         """
-        return [author.name for author in result.authors]
+        return [sys.intern(author) for author in result.authors]
@@ -0,0 +1,507 @@
+from array import array
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate, chain
+from operator import sub
+from typing import Dict, Iterable, List, Optional, Tuple
+
+"""
+      |
+  \  ___  /                           _________
+ _  /   \  _    GÉANT                 |  * *  | Co-Funded by
+    | ~ |       Trust & Identity      | *   * | the European
+     \_/        Incubator             |__*_*__| Union
+      =
+"""
+
+
+def bidirectional_bfs(indptr: array, indices: array, degree: array, src: int, dst: int) -> Optional[List[int]]:
+    """
+    Bidirectional breadth-first search kernel over CSR arrays.
+
+    A forward frontier is grown from src and a backward frontier from dst, one full layer at a
+    time, always expanding the frontier whose nodes have the fewest edges in total, i.e. the
+    cheaper layer to scan. The search stops as soon as a newly reached node has already been
+    reached by the other side. Only the nodes within roughly half the separation of each endpoint
+    are explored, and hub-heavy layers are left to the other side.
+
+    Parameters:
+        indptr (array): CSR offsets; the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): Concatenated neighbour ids of all nodes.
+        degree (array): Number of neighbours per node, i.e. indptr[i + 1] - indptr[i].
+        src (int): Id of the start node.
+        dst (int): Id of the target node.
+
+    Returns:
+        Optional[List[int]]: Node ids along a shortest path from src to dst (inclusive),
+                            or None if dst is unreachable from src.
+    """
+    if src == dst:
+        return [src]
+
+    n = len(indptr) - 1
+    pred_fwd = array('i', [-1]) * n
+    pred_bwd = array('i', [-1]) * n
+    pred_fwd[src] = src
+    pred_bwd[dst] = dst
+    frontier_fwd = [src]
+    frontier_bwd = [dst]
+    cost_fwd = degree[src]
+    cost_bwd = degree[dst]
+
+    while frontier_fwd and frontier_bwd:
+        if cost_fwd <= cost_bwd:
+            frontier_fwd, meet = _expand_layer(indptr, indices, frontier_fwd, pred_fwd, pred_bwd)
+            cost_fwd = sum(map(degree.__getitem__, frontier_fwd))
+        else:
+            frontier_bwd, meet = _expand_layer(indptr, indices, frontier_bwd, pred_bwd, pred_fwd)
+            cost_bwd = sum(map(degree.__getitem__, frontier_bwd))
+
+        if meet != -1:
+            path = [meet]
+            while path[-1] != src:
+                path.append(pred_fwd[path[-1]])
+            path.reverse()
+
+            while path[-1] != dst:
+                path.append(pred_bwd[path[-1]])
+
+            return path
+
+    return None
+
+
+def _expand_layer(indptr: array, indices: array, frontier: List[int], pred: array, other_pred: array):
+    """
+    Expand one BFS layer for one side of bidirectional_bfs.
+
+    Parameters:
+        indptr (array): CSR offsets.
+        indices (array): Concatenated neighbour ids of all nodes.
+        frontier (List[int]): Node ids reached in the previous layer of this side.
+        pred (array): Predecessor ids of this side, updated in place (-1 for not reached).
+        other_pred (array): Predecessor ids of the opposite side, used to detect the meeting node.
+
+    Returns:
+        tuple: The next frontier (List[int]) and the id of the meeting node, or -1 if the
+               two searches have not met yet.
+    """
+    next_frontier = []
+
+    for node in frontier:
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if pred[neighbor] == -1:
+                pred[neighbor] = node
+
+                if other_pred[neighbor] != -1:
+                    return next_frontier, neighbor
+
+                next_frontier.append(neighbor)
+
+    return next_frontier, -1
+
+
+def bidirectional_bfs_length(indptr: array, indices: array, degree: array, src: int, dst: int) -> Optional[int]:
+    """
+    Distance-only variant of bidirectional_bfs.
+
+    Each side records the BFS depth of the nodes it reaches instead of their predecessors, so the
+    distance is known the moment the two searches meet and no path has to be reconstructed.
+
+    Parameters:
+        indptr (array): CSR offsets; the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): Concatenated neighbour ids of all nodes.
+        degree (array): Number of neighbours per node, i.e. indptr[i + 1] - indptr[i].
+        src (int): Id of the start node.
+        dst (int): Id of the target node.
+
+    Returns:
+        Optional[int]: Number of edges on a shortest path from src to dst,
+                      or None if dst is unreachable from src.
+    """
+    if src == dst:
+        return 0
+
+    n = len(indptr) - 1
+    dist_fwd = array('i', [-1]) * n
+    dist_bwd = array('i', [-1]) * n
+    dist_fwd[src] = 0
+    dist_bwd[dst] = 0
+    frontier_fwd = [src]
+    frontier_bwd = [dst]
+    depth_fwd = 0
+    depth_bwd = 0
+    cost_fwd = degree[src]
+    cost_bwd = degree[dst]
+
+    while frontier_fwd and frontier_bwd:
+        if cost_fwd <= cost_bwd:
+            depth_fwd += 1
+            frontier_fwd, length = _expand_layer_length(indptr, indices, frontier_fwd, depth_fwd, dist_fwd, dist_bwd)
+            cost_fwd = sum(map(degree.__getitem__, frontier_fwd))
+        else:
+            depth_bwd += 1
+            frontier_bwd, length = _expand_layer_length(indptr, indices, frontier_bwd, depth_bwd, dist_bwd, dist_fwd)
+            cost_bwd = sum(map(degree.__getitem__, frontier_bwd))
+
+        if length != -1:
+            return length
+
+    return None
+
+
+def _expand_layer_length(indptr: array, indices: array, frontier: List[int], depth: int, dist: array,
+                         other_dist: array):
+    """
+    Expand one BFS layer for one side of bidirectional_bfs_length.
+
+    Parameters:
+        indptr (array): CSR offsets.
+        indices (array): Concatenated neighbour ids of all nodes.
+        frontier (List[int]): Node ids reached in the previous layer of this side.
+        depth (int): Depth of the layer being reached.
+        dist (array): Depths reached by this side, updated in place (-1 for not reached).
+        other_dist (array): Depths reached by the opposite side, used to detect the meeting node.
+
+    Returns:
+        tuple: The next frontier (List[int]) and the length of the path through the meeting node,
+               or -1 if the two searches have not met yet.
+    """
+    next_frontier = []
+
+    for node in frontier:
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if dist[neighbor] == -1:
+                dist[neighbor] = depth
+
+                if other_dist[neighbor] != -1:
+                    return next_frontier, depth + other_dist[neighbor]
+
+                next_frontier.append(neighbor)
+
+    return next_frontier, -1
+
+
+def connected_components(indptr: array, indices: array) -> array:
+    """
+    Label every node of a CSR graph with the id of its connected component.
+
+    Parameters:
+        indptr (array): CSR offsets; the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): Concatenated neighbour ids of all nodes.
+
+    Returns:
+        array: Component id per node; two nodes are connected exactly when their ids are equal.
+    """
+    n = len(indptr) - 1
+    component = array('i', [-1]) * n
+    next_component = 0
+
+    for root in range(n):
+        if component[root] != -1:
+            continue
+
+        component[root] = next_component
+        stack = [root]
+
+        while stack:
+            node = stack.pop()
+            for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                if component[neighbor] == -1:
+                    component[neighbor] = next_component
+                    stack.append(neighbor)
+
+        next_component += 1
+
+    return component
+
+
+def disjoint_set_find(parent: List[int], node: int) -> int:
+    """
+    Find the representative of a node in a disjoint-set forest, halving the path on the way.
+
+    Parameters:
+        parent (List[int]): Parent id per node; roots are their own parent. Updated in place.
+        node (int): Id of the node to look up.
+
+    Returns:
+        int: Id of the root of the node's set.
+    """
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+
+    return node
+
+
+def disjoint_set_union(parent: List[int], a: int, b: int):
+    """
+    Merge the sets of two nodes in a disjoint-set forest.
+
+    Parameters:
+        parent (List[int]): Parent id per node; roots are their own parent. Updated in place.
+        a (int): Id of a node of the first set.
+        b (int): Id of a node of the second set.
+
+    Returns:
+        None
+    """
+    root_a = disjoint_set_find(parent, a)
+    root_b = disjoint_set_find(parent, b)
+
+    if root_a != root_b:
+        parent[root_b] = root_a
+
+
+class CollaborationIndex:
+    """
+    A read-only, compressed sparse row (CSR) view of a collaboration network for fast path queries.
+    """
+
+    def __init__(self, names: List[str], indptr: array, indices: array,
+                 name_to_id: Optional[Dict[str, int]] = None, component: Optional[array] = None,
+                 path_cache_size: int = 10_000):
+        """
+        Initialize the CollaborationIndex from prebuilt CSR arrays.
+
+        Parameters:
+            names (List[str]): Author names indexed by node id.
+            indptr (array): Array of len(names) + 1 offsets; the neighbours of node i are
+                           stored in indices[indptr[i]:indptr[i + 1]].
+            indices (array): Concatenated neighbour ids of all nodes.
+            name_to_id (Optional[Dict[str, int]]): Inverse of names, if the caller already built it
+                                                  (default: None, built from names).
+            component (Optional[array]): Connected component id per node, if already known
+                                        (default: None, labelled with connected_components).
+            path_cache_size (int): Number of shortest paths kept in memory by shortest_path
+                                  (default: 10,000).
+
+        Returns:
+            None
+        """
+        if name_to_id is None:
+            name_to_id = {name: node_id for node_id, name in enumerate(names)}
+
+        if component is None:
+            component = connected_components(indptr, indices)
+
+        self.names = names
+        self.name_to_id = name_to_id
+        self.indptr = indptr
+        self.indices = indices
+        self.component = component
+        self.degree = array('i', map(sub, indptr[1:], indptr[:-1]))
+        self.path_cache_size = path_cache_size
+        self._cached_path = lru_cache(maxsize=path_cache_size)(self._find_path)
+
+    def __getstate__(self):
+        """
+        Return the state to pickle, leaving out the in-memory path cache and the degrees,
+        which are cheaper to recompute from indptr than to store.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: The index's attributes without the cache and the degrees.
+        """
+        state = self.__dict__.copy()
+        del state["_cached_path"]
+        del state["degree"]
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled index, recomputing the degrees and giving it a fresh, empty path cache.
+
+        Parameters:
+            state (dict): Attributes returned by __getstate__.
+
+        Returns:
+            None
+        """
+        self.__dict__.update(state)
+        self.degree = array('i', map(sub, self.indptr[1:], self.indptr[:-1]))
+        self._cached_path = lru_cache(maxsize=self.path_cache_size)(self._find_path)
+
+    @classmethod
+    def from_graph(cls, G):
+        """
+        Build a CollaborationIndex from a NetworkX collaboration graph.
+
+        Parameters:
+            G (nx.Graph): The collaboration network graph, e.g. from load_all_csv_edges.
+
+        Returns:
+            CollaborationIndex: Index with one integer id per author and the graph's
+                               adjacency stored in two flat integer arrays.
+        """
+        names = list(G.nodes())
+        name_to_id = {name: node_id for node_id, name in enumerate(names)}
+        adj = G.adj
+
+        # First pass: prefix sums of the node degrees give every node's slice of indices,
+        # so the neighbour array is allocated once at its final size. G.degree counts a
+        # self-loop twice, matching the two endpoints from_edges stores for it.
+        indptr = array('i', accumulate((degree for _, degree in G.degree), initial=0))
+        indices = array('i', bytes(indptr.itemsize * indptr[-1]))
+        to_id = name_to_id.__getitem__
+
+        # Second pass: fill each node's slice with its neighbour ids. A self-loop appears only
+        # once in the adjacency, so its second slot is filled separately.
+        for node_id, name in enumerate(names):
+            neighbors = array('i', map(to_id, adj[name]))
+
+            if name in adj[name]:
+                neighbors.append(node_id)
+
+            indices[indptr[node_id]:indptr[node_id + 1]] = neighbors
+
+        return cls(names, indptr, indices, name_to_id)
+
+    @classmethod
+    def from_edges(cls, names: List[str], edges: Iterable[Tuple[int, int]], component: Optional[array] = None):
+        """
+        Build a CollaborationIndex straight from integer edges, without an intermediate graph.
+
+        Parameters:
+            names (List[str]): Author names indexed by node id.
+            edges (Iterable[Tuple[int, int]]): Distinct undirected edges as pairs of node ids;
+                                              iterated twice, so it must not be a one-shot iterator.
+            component (Optional[array]): Connected component id per node, if already known
+                                        (default: None, labelled with connected_components).
+
+        Returns:
+            CollaborationIndex: Index over the given authors and edges.
+        """
+        # Counting sort: the degree of every node gives its slice of indices, and a second pass
+        # over the edges drops each endpoint into the next free slot of the other's slice.
+        degree = Counter(chain.from_iterable(edges))
+        indptr = array('i', accumulate((degree[node] for node in range(len(names))), initial=0))
+        indices = array('i', bytes(indptr.itemsize * indptr[-1]))
+        position = indptr[:-1]
+
+        for u, v in edges:
+            indices[position[u]] = v
+            position[u] += 1
+            indices[position[v]] = u
+            position[v] += 1
+
+        return cls(names, indptr, indices, component=component)
+
+    def has_node(self, name: str) -> bool:
+        """
+        Check whether an author is part of the indexed network.
+
+        Parameters:
+            name (str): The author's full name as it appears in the network.
+
+        Returns:
+            bool: True if the author is a node of the network.
+        """
+        return name in self.name_to_id
+
+    def number_of_nodes(self) -> int:
+        """
+        Return the number of authors in the indexed network.
+
+        Parameters:
+            None
+
+        Returns:
+            int: Number of nodes.
+        """
+        return len(self.names)
+
+    def number_of_edges(self) -> int:
+        """
+        Return the number of collaborations in the indexed network.
+
+        Parameters:
+            None
+
+        Returns:
+            int: Number of undirected edges.
+        """
+        return len(self.indices) // 2
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        Find a shortest collaboration path between two authors with the bidirectional_bfs kernel.
+
+        Authors in different connected components are rejected without searching. Found paths are
+        kept in an LRU cache shared by both directions of a query, so asking for (a, b) after
+        (b, a) returns the reversed cached path.
+
+        Parameters:
+            source (str): The first author's full name; must be a node of the network.
+            target (str): The second author's full name; must be a node of the network.
+
+        Returns:
+            Optional[List[str]]: Author names along the path from source to target (inclusive),
+                                or None if the authors are not connected.
+        """
+        src = self.name_to_id[source]
+        dst = self.name_to_id[target]
+
+        if self.component[src] != self.component[dst]:
+            return None
+
+        if src <= dst:
+            path = self._cached_path(src, dst)
+            step = 1
+        else:
+            path = self._cached_path(dst, src)
+            step = -1
+
+        if path is None:
+            return None
+
+        return list(path[::step])
+
+    def _find_path(self, src: int, dst: int) -> Optional[Tuple[str, ...]]:
+        """
+        Run bidirectional_bfs between two node ids; wrapped in the LRU cache used by shortest_path.
+
+        Parameters:
+            src (int): Id of the start node.
+            dst (int): Id of the target node.
+
+        Returns:
+            Optional[Tuple[str, ...]]: Author names along the path from src to dst (inclusive),
+                                      or None if the nodes are not connected.
+        """
+        path = bidirectional_bfs(self.indptr, self.indices, self.degree, src, dst)
+
+        if path is None:
+            return None
+
+        return tuple(self.names[node] for node in path)
+
+    def shortest_path_length(self, source: str, target: str) -> Optional[int]:
+        """
+        Find the degrees of separation between two authors without building the path itself.
+
+        Parameters:
+            source (str): The first author's full name; must be a node of the network.
+            target (str): The second author's full name; must be a node of the network.
+
+        Returns:
+            Optional[int]: Number of collaborations on a shortest path between the authors,
+                          or None if the authors are not connected.
+        """
+        src = self.name_to_id[source]
+        dst = self.name_to_id[target]
+
+        if self.component[src] != self.component[dst]:
+            return None
+
+        return bidirectional_bfs_length(self.indptr, self.indices, self.degree, src, dst)
+
+
+# The compiled kernels of _fastgraph replace the pure-Python ones above when the extension has been
+# built (cythonize -i arxiv_api/clients/_fastgraph.pyx); CollaborationIndex looks them up at call time.
+try:
+    from arxiv_api.clients._fastgraph import bidirectional_bfs, bidirectional_bfs_length, connected_components
+except ImportError:
+    pass
@@ -1,11 +1,22 @@
+import asyncio
+import functools
+import gzip
+import hashlib
 import os.path
+import pickle
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import itemgetter
 
 import networkx as nx
 import matplotlib.pyplot as plt
 import csv
 import json
 from arxiv_api.clients.arxiv_client import ArxivClient
-from collections import deque
+from arxiv_api.clients.collaboration_index import CollaborationIndex, disjoint_set_find, disjoint_set_union
 
 """
       |   
@@ -16,6 +27,26 @@ from collections import deque
       =
 """
 
+# Large reads keep the number of read calls low when streaming big edge files.
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# Edge files picked up by the loaders: plain, gzip-compressed and Zstandard-compressed CSV.
+CSV_EDGE_SUFFIXES = (".csv", ".csv.gz", ".csv.zst")
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(directory):
+    """
+    Create an output directory once per process; later calls for the same path are no-ops.
+
+    Parameters:
+        directory (str): Path of the directory to create if missing.
+
+    Returns:
+        None
+    """
+    os.makedirs(directory, exist_ok=True)
+
 
 class GraphClient:
     """
@@ -34,8 +65,8 @@ class GraphClient:
         """
         self.arxiv_client = ArxivClient()
 
-    @staticmethod
-    def build_collaboration_network(start_author, max_depth=2):
+    def build_collaboration_network(self, start_author, max_depth=2, max_concurrency=5, batch_size=20,
+                                    max_papers_per_author=50, max_coauthors_per_paper=50):
         """
         Build a collaboration network graph by exploring co-authorship relationships from a starting author.
 
@@ -44,6 +75,18 @@ class GraphClient:
                                Should match ArXiv author name formatting for optimal results.
             max_depth (int): Maximum degrees of separation to explore from the starting author
                            (default: 2). Higher values result in exponentially larger networks.
+                           All searches go through the shared self.arxiv_client instance.
+            max_concurrency (int): Maximum number of ArXiv searches in flight at once for the
+                                  authors of one depth level (default: 5).
+            batch_size (int): Number of authors of one depth level combined into a single
+                             OR-query to ArXiv (default: 20).
+            max_papers_per_author (int): Number of most recent publications fetched per author
+                                        (default: 50). Smaller values fetch fewer and smaller pages.
+            max_coauthors_per_paper (int): Publications with more authors than this are skipped
+                                          (default: 50, None to keep all). Large consortium papers
+                                          would otherwise add thousands of authors to the next depth
+                                          level; skipping them bounds run time and memory at the cost
+                                          of omitting those collaborations from the network.
 
         Returns:
             nx.Graph: NetworkX graph object representing the collaboration network where:
@@ -52,44 +95,80 @@ class GraphClient:
                      - Graph includes all authors within max_depth collaborations
                      Returns empty graph if starting author has no publications or network errors occur.
         """
+        return asyncio.run(self._bfs_async(start_author, max_depth, max_concurrency, batch_size,
+                                           max_papers_per_author, max_coauthors_per_paper))
+
+    async def _bfs_async(self, start_author, max_depth, max_concurrency, batch_size, max_papers_per_author,
+                         max_coauthors_per_paper):
+        """
+        Level-synchronous breadth-first exploration used by build_collaboration_network.
+
+        The authors of one depth level are split into batches searched with one query each;
+        batches run concurrently, bounded by a semaphore, while the ArxivClient keeps the
+        politeness delay between individual requests. Every author is enqueued at most once,
+        so each depth level holds only distinct, not yet visited authors.
+
+        Parameters:
+            start_author (str): The full name of the author to begin network exploration from.
+            max_depth (int): Maximum degrees of separation to explore from the starting author.
+            max_concurrency (int): Maximum number of ArXiv searches in flight at once.
+            batch_size (int): Number of authors combined into a single ArXiv query.
+            max_papers_per_author (int): Number of most recent publications fetched per author.
+            max_coauthors_per_paper (int): Publications with more authors than this are skipped.
+
+        Returns:
+            nx.Graph: The collaboration network graph.
+        """
         G = nx.Graph()
-        processed_authors = set()
-        queue = deque([(start_author, 0)])
+        G.add_node(start_author)
+        enqueued = {start_author}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        frontier = [start_author]
+        add_edges_from = G.add_edges_from
+        get_coauthors = ArxivClient.get_coauthors
 
-        while queue:
-            current_author, depth = queue.popleft()
+        async def fetch(batch):
+            async with semaphore:
+                return await asyncio.to_thread(self.arxiv_client.search_arxiv_publications_batch, batch,
+                                               max_papers_per_author)
 
-            if current_author in processed_authors:
-                continue
+        for depth in range(max_depth + 1):
+            for current_author in frontier:
+                print(f"Processing author: {current_author} (depth {depth})")
 
-            processed_authors.add(current_author)
-            print(f"Processing author: {current_author} (depth {depth})")
+            if depth >= max_depth or not frontier:
+                break
 
-            if not G.has_node(current_author):
-                G.add_node(current_author)
+            batches = [frontier[i:i + batch_size] for i in range(0, len(frontier), batch_size)]
+            level_results = {}
 
-            if depth >= max_depth:
-                continue
+            for batch_results in await asyncio.gather(*[fetch(batch) for batch in batches]):
+                level_results.update(batch_results)
 
-            results = ArxivClient.search_arxiv_publications(current_author)
+            next_frontier = []
+            mark = enqueued.add
+            append = next_frontier.append
 
-            if not results:
-                continue
+            for current_author in frontier:
+                for r in level_results[current_author]:
+                    if max_coauthors_per_paper is not None and len(r.authors) > max_coauthors_per_paper:
+                        continue
 
-            for r in results:
-                coauthors = ArxivClient.get_coauthors(r)
+                    coauthors = get_coauthors(r)
+                    add_edges_from((current_author, coauthor) for coauthor in coauthors if coauthor != current_author)
 
-                for coauthor in coauthors:
-                    if coauthor != current_author:
-                        G.add_edge(current_author, coauthor)
+                    # current_author is already enqueued, so it is never appended here.
+                    for coauthor in coauthors:
+                        if coauthor not in enqueued:
+                            mark(coauthor)
+                            append(coauthor)
 
-                        if coauthor not in processed_authors:
-                            queue.append((coauthor, depth + 1))
+            frontier = next_frontier
 
         return G
 
     @staticmethod
-    def visualize_network(G, author, max_depth):
+    def visualize_network(G, author, max_depth, max_labeled_nodes=500):
         """
         Generate and save a visual representation of the collaboration network as a PNG image.
 
@@ -99,6 +178,9 @@ class GraphClient:
             author (str): The starting author name used for filename generation.
                          Special characters and spaces will be removed for file compatibility.
             max_depth (int): The depth parameter used in network construction for filename labeling.
+            max_labeled_nodes (int): Largest network drawn with author name labels (default: 500).
+                                    Bigger networks are drawn without labels, since every label is a
+                                    separate Matplotlib text artist and they are unreadable at that size.
 
         Returns:
             None: Creates and saves a high-resolution network visualization to '../images_database/'
@@ -106,10 +188,10 @@ class GraphClient:
                  Displays the graph and prints save confirmation message.
         """
         plt.figure(figsize=(50, 25))
-        pos = nx.spring_layout(G, seed=42, k=0.3, iterations=100)
+        pos = GraphClient.compute_layout(G)
 
         nx.draw(G, pos,
-                with_labels=True,
+                with_labels=G.number_of_nodes() <= max_labeled_nodes,
                 node_color='skyblue',
                 node_size=300,
                 edge_color='gray',
@@ -121,9 +203,7 @@ class GraphClient:
         plt.tight_layout()
         plt.subplots_adjust(left=0.02, right=0.98, top=0.95, bottom=0.05)
 
-        filename = "../images_database/" + "collaboration_network_" + author.replace(" ", "") + "_depth_" + str(
-            max_depth) + ".png"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        filename = GraphClient._output_filename("../images_database", author, max_depth, "png")
 
         plt.savefig(filename, dpi=300)
         print(f"Graph image saved as {filename}")
@@ -132,7 +212,57 @@ class GraphClient:
         plt.close()
 
     @staticmethod
-    def save_edges_to_csv(G, author, max_depth):
+    def _output_filename(folder, author, max_depth, extension):
+        """
+        Build the path of an exported file and make sure its folder exists.
+
+        Parameters:
+            folder (str): Output directory, e.g. "../csv_database".
+            author (str): The starting author name; spaces are removed for file system compatibility.
+            max_depth (int): The network depth parameter for filename labeling.
+            extension (str): File extension without the leading dot.
+
+        Returns:
+            str: Path of the form '[folder]/collaboration_network_[author]_depth_[depth].[extension]'.
+        """
+        _ensure_dir(folder)
+        return f"{folder}/collaboration_network_{author.replace(' ', '')}_depth_{max_depth}.{extension}"
+
+    @staticmethod
+    def compute_layout(G, cache_folder="../layout_cache"):
+        """
+        Compute the spring layout of a collaboration network, reusing a previously computed
+        layout of the same graph from disk.
+
+        Parameters:
+            G (nx.Graph): The collaboration network graph to lay out.
+            cache_folder (str): Directory holding pickled layouts keyed by a hash of the graph's
+                               nodes and edges (default: "../layout_cache").
+
+        Returns:
+            dict: Mapping from each node to its (x, y) position, as returned by nx.spring_layout.
+        """
+        layout_hash = hashlib.blake2b(digest_size=16)
+        layout_hash.update(b"spring_layout:seed=42:k=0.3:iterations=100\n")
+        layout_hash.update(repr(sorted(G.nodes())).encode("utf-8"))
+        layout_hash.update(repr(sorted(tuple(sorted(edge)) for edge in G.edges())).encode("utf-8"))
+
+        filename = os.path.join(cache_folder, layout_hash.hexdigest() + ".pkl")
+
+        if os.path.exists(filename):
+            with open(filename, "rb") as f:
+                return pickle.load(f)
+
+        pos = nx.spring_layout(G, seed=42, k=0.3, iterations=100)
+
+        _ensure_dir(cache_folder)
+        with open(filename, "wb") as f:
+            pickle.dump(pos, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return pos
+
+    @staticmethod
+    def save_edges_to_csv(G, author, max_depth, edges=None):
         """
         Export collaboration network edges to a CSV file for external analysis or data sharing.
 
@@ -142,6 +272,8 @@ class GraphClient:
             author (str): The starting author name for filename generation.
                          Spaces will be removed for file system compatibility.
             max_depth (int): The network depth parameter for filename labeling.
+            edges (list): Edge list of G to write instead of iterating G.edges() again
+                         (default: None). Used by save_all to share one edge pass.
 
         Returns:
             None: Creates CSV file in '../csv_database/' directory with format
@@ -149,21 +281,38 @@ class GraphClient:
                  two columns: 'Author1' and 'Author2' representing each collaboration edge.
                  Prints confirmation message with full file path.
         """
-        filename = "../csv_database/" + "collaboration_network_" + author.replace(" ", "") + "_depth_" + str(
-            max_depth) + ".csv"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        filename = GraphClient._output_filename("../csv_database", author, max_depth, "csv")
 
-        with open(filename, mode='w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(["Author1", "Author2"])
+        if edges is None:
+            edges = G.edges()
 
-            for u, v in G.edges():
-                writer.writerow([u, v])
+        csv_field = GraphClient._csv_field
+        lines = ["Author1,Author2"]
+        lines.extend(f"{csv_field(u)},{csv_field(v)}" for u, v in edges)
+
+        with open(filename, mode='w', newline='', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
 
         print(f"Collaboration edges saved to {filename}")
 
     @staticmethod
-    def save_edges_to_json(G, author, max_depth):
+    def _csv_field(value):
+        """
+        Format a single CSV field, quoting it only when it contains a delimiter, quote or line break.
+
+        Parameters:
+            value (str): The raw field value, typically an author name.
+
+        Returns:
+            str: The value unchanged, or wrapped in double quotes with inner quotes doubled,
+                 matching the output of csv.writer with its default minimal quoting.
+        """
+        if any(char in value for char in ',"\r\n'):
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
+    @staticmethod
+    def save_edges_to_json(G, author, max_depth, edges=None):
         """
         Export collaboration network edges to a JSON file with source-target format for web visualization.
 
@@ -173,6 +322,8 @@ class GraphClient:
             author (str): The starting author name for filename generation.
                          Spaces removed automatically for file naming.
             max_depth (int): The network exploration depth for filename identification.
+            edges (list): Edge list of G to write instead of iterating G.edges() again
+                         (default: None). Used by save_all to share one edge pass.
 
         Returns:
             None: Creates JSON file in '../json_database/' with structure containing
@@ -180,19 +331,20 @@ class GraphClient:
                  File saved as 'collaboration_network_[author]_depth_[depth].json'.
                  Prints save confirmation message.
         """
-        filename = "../json_database/" + "collaboration_network_" + author.replace(" ", "") + "_depth_" + str(
-            max_depth) + ".json"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        filename = GraphClient._output_filename("../json_database", author, max_depth, "json")
+
+        if edges is None:
+            edges = G.edges()
 
-        edge_list = [{"source": u, "target": v} for u, v in G.edges()]
+        edge_list = [{"source": u, "target": v} for u, v in edges]
 
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(edge_list, f, indent=2)
+            f.write(json.dumps(edge_list, separators=(",", ":")))
 
         print(f"Collaboration edges saved to {filename}")
 
     @staticmethod
-    def save_edges_to_sigma_json(G, author, max_depth):
+    def save_edges_to_sigma_json(G, author, max_depth, edges=None):
         """
         Export collaboration network in Sigma.js compatible JSON format for interactive web visualization.
 
@@ -202,71 +354,417 @@ class GraphClient:
             author (str): The starting author name for filename generation.
                          Processed to remove spaces for file system compatibility.
             max_depth (int): The network depth parameter for filename labeling.
+            edges (list): Edge list of G to write instead of iterating G.edges() again
+                         (default: None). Used by save_all to share one edge pass.
 
         Returns:
-            None: Creates Sigma.js format JSON file containing 'nodes' array with id/label fields
-                 and 'edges' array with id/source/target fields. Saved to '../sigma_json_database/'
+            None: Creates Sigma.js format JSON file containing 'nodes' array with integer id and
+                 author name label fields, and 'edges' array with integer id and source/target
+                 fields referring to node ids. Saved to '../sigma_json_database/'
                  as 'collaboration_network_[author]_depth_[depth].json'.
                  Overwrites basic JSON format. Prints confirmation message.
         """
-        filename = "../sigma_json_database/" + "collaboration_network_" + author.replace(" ", "") + "_depth_" + str(
-            max_depth) + ".json"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        filename = GraphClient._output_filename("../sigma_json_database", author, max_depth, "json")
+
+        if edges is None:
+            edges = G.edges()
+
+        name_to_id = {node: node_id for node_id, node in enumerate(G.nodes())}
 
         data = {
-            "nodes": [{"id": node, "label": node} for node in G.nodes()],
-            "edges": [{"id": f"{u}_{v}", "source": u, "target": v} for u, v in G.edges()]
+            "nodes": [{"id": node_id, "label": node} for node, node_id in name_to_id.items()],
+            "edges": [{"id": edge_id, "source": name_to_id[u], "target": name_to_id[v]}
+                      for edge_id, (u, v) in enumerate(edges)]
         }
 
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filename, "w", encoding='utf-8') as f:
+            f.write(json.dumps(data, separators=(",", ":")))
 
         print(f"Collaboration edges saved to {filename}")
 
     @staticmethod
-    def load_all_csv_edges(csv_folder="../csv_database"):
+    def save_all(G, author, max_depth, formats=("csv", "sigma_json")):
+        """
+        Export the collaboration network in several formats from a single pass over its edges.
+
+        Parameters:
+            G (nx.Graph): The collaboration network graph for export.
+            author (str): The starting author name for filename generation.
+            max_depth (int): The network depth parameter for filename labeling.
+            formats (tuple): Formats to write, any of "csv", "json" and "sigma_json"
+                            (default: ("csv", "sigma_json")).
+
+        Returns:
+            None: Writes each requested format through save_edges_to_csv, save_edges_to_json and
+                 save_edges_to_sigma_json, all sharing one materialized edge list.
+        """
+        edges = list(G.edges())
+
+        if "csv" in formats:
+            GraphClient.save_edges_to_csv(G, author, max_depth, edges)
+        if "json" in formats:
+            GraphClient.save_edges_to_json(G, author, max_depth, edges)
+        if "sigma_json" in formats:
+            GraphClient.save_edges_to_sigma_json(G, author, max_depth, edges)
+
+    @staticmethod
+    def load_all_csv_edges(csv_folder="../csv_database", processes=None, use_cache=True):
         """
         Load and combine multiple CSV edge files into a single collaboration network graph.
 
+        Files are parsed in parallel and merged with integer author ids by _collect_csv_edges; the
+        deduplicated edges are then added to the graph in one call. The combined graph is pickled
+        next to the CSV files and reused on later runs for as long as no CSV file is added, removed
+        or modified.
+
         Parameters:
             csv_folder (str): Path to directory containing CSV files with collaboration edges
                              (default: "../csv_database"). Files should have 'Author1,Author2' format
-                             with header row.
+                             with header row, and may be gzip (.csv.gz) or Zstandard (.csv.zst)
+                             compressed; the latter requires the zstandard package.
+            processes (int): Number of worker processes used for parsing (default: None, one per
+                            CPU core, capped at the number of files).
+            use_cache (bool): Whether to read and write the pickled graph cache '_graph.pkl'
+                             in csv_folder (default: True).
 
         Returns:
             nx.Graph: Combined NetworkX graph containing all edges from CSV files where:
                      - Nodes represent unique authors across all files
                      - Edges represent all collaboration relationships found
                      - Duplicate edges are automatically merged
+                     - Author names are interned, so repeated names share one string object
                      Returns empty graph if no valid CSV files found or folder doesn't exist.
         """
-        G = nx.Graph()
+        filenames = [filename for filename in os.listdir(csv_folder) if filename.endswith(CSV_EDGE_SUFFIXES)]
+        filepaths = [os.path.join(csv_folder, filename) for filename in filenames]
+        cache_path = os.path.join(csv_folder, "_graph.pkl")
 
-        for filename in os.listdir(csv_folder):
-            if filename.endswith(".csv"):
-                filepath = os.path.join(csv_folder, filename)
-                print(f"Loading edges from {filename}...")
+        G = GraphClient._read_cache(cache_path, filenames, filepaths) if use_cache else None
 
-                with open(filepath, newline='', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    next(reader)
+        if G is not None:
+            print(f"Loaded cached graph from {cache_path}")
+            print(f"\nTotal nodes: {G.number_of_nodes()}")
+            print(f"Total edges: {G.number_of_edges()}")
+            return G
 
-                    for row in reader:
-                        if len(row) == 2:
-                            G.add_edge(row[0], row[1])
+        names, edges, _ = GraphClient._collect_csv_edges(filenames, filepaths, processes)
+
+        G = nx.Graph()
+        G.add_edges_from((names[u], names[v]) for u, v in edges)
+
+        if use_cache:
+            GraphClient._write_cache(cache_path, filenames, G)
 
         print(f"\nTotal nodes: {G.number_of_nodes()}")
         print(f"Total edges: {G.number_of_edges()}")
         return G
 
+    @staticmethod
+    def load_collaboration_index(csv_folder="../csv_database", processes=None, use_cache=True):
+        """
+        Load and combine multiple CSV edge files straight into a CollaborationIndex.
+
+        Skips the NetworkX graph built by load_all_csv_edges for callers that only run path
+        queries. The connected components found while merging the files are kept, so queries
+        between unconnected authors are answered without a search. Like the graph, the index is
+        pickled next to the CSV files and reused while none of them changes.
+
+        Parameters:
+            csv_folder (str): Path to directory containing CSV files with collaboration edges
+                             (default: "../csv_database"). Files should have 'Author1,Author2' format
+                             with header row, and may be gzip (.csv.gz) or Zstandard (.csv.zst)
+                             compressed; the latter requires the zstandard package.
+            processes (int): Number of worker processes used for parsing (default: None, one per
+                            CPU core, capped at the number of files).
+            use_cache (bool): Whether to read and write the pickled index cache '_index.pkl'
+                             in csv_folder (default: True).
+
+        Returns:
+            CollaborationIndex: Index over all authors and collaborations found in the CSV files,
+                               accepted by find_connection and connection_distance.
+        """
+        filenames = [filename for filename in os.listdir(csv_folder) if filename.endswith(CSV_EDGE_SUFFIXES)]
+        filepaths = [os.path.join(csv_folder, filename) for filename in filenames]
+        cache_path = os.path.join(csv_folder, "_index.pkl")
+
+        index = GraphClient._read_cache(cache_path, filenames, filepaths) if use_cache else None
+
+        if index is not None:
+            print(f"Loaded cached collaboration index from {cache_path}")
+        else:
+            names, edges, component = GraphClient._collect_csv_edges(filenames, filepaths, processes)
+            index = CollaborationIndex.from_edges(names, edges, component)
+
+            if use_cache:
+                GraphClient._write_cache(cache_path, filenames, index)
+
+        print(f"\nTotal nodes: {index.number_of_nodes()}")
+        print(f"Total edges: {index.number_of_edges()}")
+        return index
+
+    @staticmethod
+    def _collect_csv_edges(filenames, filepaths, processes=None):
+        """
+        Parse CSV edge files and merge their edges, giving every author an integer id on first sight.
+
+        Files are parsed in parallel by a pool of worker processes; the edges of each file are merged
+        in the main process as soon as they arrive. Deduplication then compares and hashes pairs of
+        small integers instead of pairs of names. Connected components are tracked along the way
+        with a disjoint-set forest, merging the per-file components found by the workers.
+
+        Parameters:
+            filenames (list): Names of the CSV files, used for progress messages.
+            filepaths (list): Paths of the CSV files, in the same order as filenames.
+            processes (int): Number of worker processes used for parsing (default: None, one per
+                            CPU core, capped at the number of files).
+
+        Returns:
+            tuple: The author names indexed by id (list), the distinct edges as (id1, id2) pairs
+                   with id1 <= id2 (dict used as an insertion-ordered set), and the connected
+                   component id per author (array; equal ids mean the authors are connected).
+        """
+        # Ids are handed out in order of first appearance, so the dict's keys double as the
+        # id-to-name list and every occurrence of a name shares the string object seen first.
+        ids = {}
+        node_id = ids.setdefault
+        edges = {}
+        parent = []
+
+        # Worker processes are only started on the first submit, so a single file is parsed inline.
+        with ProcessPoolExecutor(max(1, min(processes or os.cpu_count() or 1, len(filepaths)))) as executor:
+            read = GraphClient._read_csv_edge_ids
+            parsed_files = executor.map(read, filepaths) if len(filepaths) > 1 else map(read, filepaths)
+
+            # Results arrive in file order as soon as each file is parsed, so merging a file's edges
+            # overlaps with the workers still parsing the remaining ones.
+            for filename, (file_names, file_edges, file_roots) in zip(filenames, parsed_files):
+                print(f"Loading edges from {filename}...")
+
+                # Only the file's distinct names are looked up by string; its edges are translated
+                # from local to global ids through a list.
+                to_global = [node_id(name, len(ids)) for name in file_names]
+                ends = map(to_global.__getitem__, file_edges)
+
+                for u, v in zip(ends, ends):
+                    edges[(u, v) if u <= v else (v, u)] = None
+
+                # Authors connected within the file are connected overall, so one union per author
+                # with its local root is enough to fold the file's components into the global ones.
+                parent.extend(range(len(parent), len(ids)))
+
+                for node, root in enumerate(file_roots):
+                    if node != root:
+                        disjoint_set_union(parent, to_global[root], to_global[node])
+
+        component = array('i', [disjoint_set_find(parent, node) for node in range(len(parent))])
+
+        return list(ids), edges, component
+
+    @staticmethod
+    def _read_csv_edge_ids(filepath):
+        """
+        Parse a single CSV edge file and number its authors locally; runs in a worker process of
+        _collect_csv_edges.
+
+        Naming and deduplicating the file's edges in the worker leaves the main process only one
+        string lookup per distinct name, and the edges travel back as a flat integer array, which
+        is far cheaper to transfer between processes than a list of name tuples.
+
+        Parameters:
+            filepath (str): Path to a CSV file with 'Author1,Author2' header row, optionally compressed.
+
+        Returns:
+            tuple: The file's author names in order of first appearance (list), its distinct edges
+                   as an array of local id pairs laid out as id1, id2, id1, id2, ..., and the local
+                   id of the root of each author's connected component within the file (array).
+        """
+        ids = {}
+        node_id = ids.setdefault
+        edges = {}
+
+        for u, v in GraphClient._read_csv_edges(filepath):
+            u = node_id(u, len(ids))
+            v = node_id(v, len(ids))
+            edges[(u, v) if u <= v else (v, u)] = None
+
+        parent = list(range(len(ids)))
+
+        for u, v in edges:
+            disjoint_set_union(parent, u, v)
+
+        roots = array('i', [disjoint_set_find(parent, node) for node in range(len(parent))])
+
+        return list(ids), array('i', chain.from_iterable(edges)), roots
+
+    @staticmethod
+    def _read_cache(cache_path, filenames, filepaths):
+        """
+        Load a pickled object built from CSV files, provided it is still up to date.
+
+        Parameters:
+            cache_path (str): Path of the pickle file.
+            filenames (list): Names of the CSV files the object must have been built from.
+            filepaths (list): Paths of those CSV files, checked against the cache's modification time.
+
+        Returns:
+            object: The cached object, or None if the cache is missing, unreadable, older than any
+                   of the CSV files, or was built from a different set of files.
+        """
+        if not os.path.exists(cache_path):
+            return None
+
+        if any(os.path.getmtime(filepath) > os.path.getmtime(cache_path) for filepath in filepaths):
+            return None
+
+        # A damaged cache is treated like a missing one, so it gets rebuilt and overwritten.
+        try:
+            with open(cache_path, "rb") as f:
+                cached_filenames, cached = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+
+        if cached_filenames != sorted(filenames):
+            return None
+
+        return cached
+
+    @staticmethod
+    def _write_cache(cache_path, filenames, obj):
+        """
+        Pickle an object built from CSV files together with the list of those files.
+
+        The pickle is written to a temporary file next to cache_path and then moved over it, so an
+        interrupted write never leaves a truncated cache behind.
+
+        Parameters:
+            cache_path (str): Path of the pickle file.
+            filenames (list): Names of the CSV files the object was built from.
+            obj (object): The object to cache, e.g. the combined collaboration graph.
+
+        Returns:
+            None
+        """
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(cache_path) or ".")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((sorted(filenames), obj), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _open_csv(filepath):
+        """
+        Open a CSV edge file for reading as text, decompressing it on the fly if needed.
+
+        Parameters:
+            filepath (str): Path to a '.csv', '.csv.gz' or '.csv.zst' file.
+
+        Returns:
+            io.TextIOBase: Text stream over the file's UTF-8 content, opened with newline=''
+                          as the csv module expects.
+        """
+        if filepath.endswith(".gz"):
+            return gzip.open(filepath, "rt", encoding="utf-8", newline="")
+
+        if filepath.endswith(".zst"):
+            import zstandard
+            return zstandard.open(filepath, "rt", encoding="utf-8", newline="")
+
+        return open(filepath, newline='', encoding='utf-8', buffering=CSV_READ_BUFFER_SIZE)
+
+    @staticmethod
+    def _read_csv_edges(filepath):
+        """
+        Parse a single CSV edge file into name pairs; called by _read_csv_edge_ids, which runs in a
+        worker process of _collect_csv_edges.
+
+        Plain 'Author1,Author2' lines are split with str.partition. A file with quoted fields or
+        more than two columns is handed to _read_csv_edges_with_csv_module instead, which applies
+        the same rules to the rows it reads.
+
+        Parameters:
+            filepath (str): Path to a CSV file with 'Author1,Author2' header row, optionally compressed.
+
+        Returns:
+            list: List of (author1, author2) tuples taken from the first two columns of each row;
+                 rows with fewer than two columns or an empty author field are skipped, and any
+                 further columns are ignored.
+        """
+        edges = []
+        append = edges.append
+
+        # An empty file has no header to skip and simply yields no edges.
+        with GraphClient._open_csv(filepath) as f:
+            next(f, None)
+
+            for line in f:
+                u, _, v = line.rstrip("\r\n").partition(",")
+
+                if '"' in line or "," in v:
+                    return GraphClient._read_csv_edges_with_csv_module(filepath)
+
+                if u and v:
+                    append((u, v))
+
+        return edges
+
+    @staticmethod
+    def _read_csv_edges_with_csv_module(filepath):
+        """
+        Parse a single CSV edge file with the csv module, honouring quoted fields.
+
+        Parameters:
+            filepath (str): Path to a CSV file with 'Author1,Author2' header row, optionally compressed.
+
+        Returns:
+            list: List of (author1, author2) tuples taken from the first two columns of each row;
+                 rows with fewer than two columns or an empty author field are skipped, and any
+                 further columns are ignored.
+        """
+        # Files written by save_edges_to_csv always have two columns, so rows are not validated
+        # one by one; a malformed row makes the fast path fail and the file is parsed again.
+        with GraphClient._open_csv(filepath) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+
+            try:
+                return [(u, v) for u, v in map(itemgetter(0, 1), filter(None, reader)) if u and v]
+            except IndexError:
+                pass
+
+        with GraphClient._open_csv(filepath) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            return [(row[0], row[1]) for row in reader if len(row) >= 2 and row[0] and row[1]]
+
+    @staticmethod
+    def build_collaboration_index(G):
+        """
+        Convert a collaboration network graph into a CollaborationIndex for repeated path queries.
+
+        Parameters:
+            G (nx.Graph): The collaboration network graph, e.g. from load_all_csv_edges.
+
+        Returns:
+            CollaborationIndex: CSR representation of the graph with integer node ids,
+                               accepted by find_connection in place of the graph.
+        """
+        return CollaborationIndex.from_graph(G)
+
     @staticmethod
     def find_connection(G, author1, author2):
         """
         Find and display the shortest collaboration path between two authors in the network.
 
         Parameters:
-            G (nx.Graph): The collaboration network graph to search within.
+            G (nx.Graph or CollaborationIndex): The collaboration network to search within.
                          Must contain both authors as nodes for successful path finding.
+                         A graph is searched directly with NetworkX; for many queries, build a
+                         CollaborationIndex once with build_collaboration_index and pass that.
             author1 (str): The first author's full name as it appears in the network.
                           Name matching is case-sensitive and must be exact.
             author2 (str): The second author's full name for connection endpoint.
@@ -287,14 +785,63 @@ class GraphClient:
             print(f"Author '{author2}' not found in the network.")
             return
 
-        try:
-            path = nx.shortest_path(G, source=author1, target=author2)
-            print(f"\nConnection found between '{author1}' and '{author2}':")
-            for i, author in enumerate(path):
-                if i == 0:
-                    print(f"  {author}")
-                else:
-                    print(f"    {author}")
-            print(f"\nDegrees of separation: {len(path) - 1}")
-        except nx.NetworkXNoPath:
+        # Converting a graph costs far more than one search, so only an index passed in is used.
+        if isinstance(G, nx.Graph):
+            try:
+                path = nx.bidirectional_shortest_path(G, author1, author2)
+            except nx.NetworkXNoPath:
+                path = None
+        else:
+            path = G.shortest_path(author1, author2)
+
+        if path is None:
+            print(f"No connection found between '{author1}' and '{author2}'.")
+            return
+
+        # The whole report is assembled first and written at once instead of one print per author.
+        lines = [f"\nConnection found between '{author1}' and '{author2}':", f"  {path[0]}"]
+        lines.extend(f"    {author}" for author in path[1:])
+        lines.append(f"\nDegrees of separation: {len(path) - 1}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def connection_distance(G, author1, author2):
+        """
+        Find and display only the degrees of separation between two authors in the network.
+
+        Cheaper than find_connection when the intermediaries are not needed, as the shortest path
+        itself is never reconstructed.
+
+        Parameters:
+            G (nx.Graph or CollaborationIndex): The collaboration network to search within.
+                         A graph is searched directly with NetworkX; for many queries, build a
+                         CollaborationIndex once with build_collaboration_index and pass that.
+            author1 (str): The first author's full name as it appears in the network.
+            author2 (str): The second author's full name as it appears in the network.
+
+        Returns:
+            int: Degrees of separation between the authors, or None if either author is not
+                 found or the authors are not connected; the outcome is also printed.
+        """
+        if not G.has_node(author1):
+            print(f"Author '{author1}' not found in the network.")
+            return None
+
+        if not G.has_node(author2):
+            print(f"Author '{author2}' not found in the network.")
+            return None
+
+        if isinstance(G, nx.Graph):
+            try:
+                distance = nx.shortest_path_length(G, author1, author2)
+            except nx.NetworkXNoPath:
+                distance = None
+        else:
+            distance = G.shortest_path_length(author1, author2)
+
+        if distance is None:
             print(f"No connection found between '{author1}' and '{author2}'.")
+            return None
+
+        print(f"\nDegrees of separation between '{author1}' and '{author2}': {distance}")
+        return distance
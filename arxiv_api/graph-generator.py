@@ -31,15 +31,14 @@ def main():
 
     try:
         print(f"Building collaboration network starting from '{author_name}' with depth {max_depth}...")
-        G = GraphClient.build_collaboration_network(author_name, max_depth)
+        graph_client = GraphClient()
+        G = graph_client.build_collaboration_network(author_name, max_depth)
 
         print(f"\nNetwork statistics:")
         print(f"Number of authors: {G.number_of_nodes()}")
         print(f"Number of collaborations: {G.number_of_edges()}")
 
-        GraphClient.save_edges_to_csv(G, author_name, max_depth)
-        # GraphClient.save_edges_to_json(G, author_name, max_depth)
-        GraphClient.save_edges_to_sigma_json(G, author_name, max_depth)
+        GraphClient.save_all(G, author_name, max_depth)
         GraphClient.visualize_network(G, author_name, max_depth)
 
     except Exception as e:
@@ -30,7 +30,8 @@ def main():
 
     try:
         print(f"Searching for publications by '{author_name}'...")
-        results = ArxivClient.search_arxiv_publications(author_name, max_results)
+        arxiv_client = ArxivClient()
+        results = arxiv_client.search_arxiv_publications(author_name, max_results)
 
         ArxivClient.display_publication_info(results)
 
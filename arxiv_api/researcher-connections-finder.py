@@ -16,7 +16,8 @@ def main():
 
     Loads collaboration networks from CSV files and prompts the user
     for two researcher names, then uses GraphClient to find and display
-    the shortest collaboration path between them if present.
+    the shortest collaboration path between them if present, or only the
+    degrees of separation if the user asks for the distance alone.
 
     Parameters:
         None
@@ -24,13 +25,18 @@ def main():
     Returns:
         None
     """
-    G = GraphClient.load_all_csv_edges()
+    index = GraphClient.load_collaboration_index()
 
     print("\nResearcher Connection Finder")
     author1 = input("Enter the first researcher's name: ").strip()
     author2 = input("Enter the second researcher's name: ").strip()
 
-    GraphClient.find_connection(G, author1, author2)
+    mode = input("Show the full path or the distance only? [path/distance]: ").strip().lower()
+
+    if mode.startswith("d"):
+        GraphClient.connection_distance(index, author1, author2)
+    else:
+        GraphClient.find_connection(index, author1, author2)
 
 
 if __name__ == "__main__":
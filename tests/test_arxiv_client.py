@@ -0,0 +1,244 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from arxiv_api.clients import arxiv_client
+from arxiv_api.clients.arxiv_client import BATCH_CACHE_NAMESPACE, ArxivClient, Publication
+
+"""
+      |
+  \  ___  /                           _________
+ _  /   \  _    GÉANT                 |  * *  | Co-Funded by
+    | ~ |       Trust & Identity      | *   * | the European
+     \_/        Incubator             |__*_*__| Union
+      =
+"""
+
+
+def atom_feed(entries, total_results):
+    """
+    Render a minimal ArXiv Atom feed.
+
+    Parameters:
+        entries (list): (entry id, title, year, authors, categories) tuples.
+        total_results (int): Value of the feed's opensearch:totalResults.
+
+    Returns:
+        bytes: The feed as UTF-8 XML.
+    """
+    body = "".join(
+        f"<entry><id>{entry_id}</id><title>{title}</title><published>{year}-01-01T00:00:00Z</published>"
+        + "".join(f"<author><name>{author}</name></author>" for author in authors)
+        + "".join(f'<category term="{category}"/>' for category in categories)
+        + "</entry>"
+        for entry_id, title, year, authors, categories in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        f"<opensearch:totalResults>{total_results}</opensearch:totalResults>{body}</feed>"
+    ).encode("utf-8")
+
+
+def publication(title, year, *authors):
+    return Publication(title, list(authors), year, ["cs.DL"], f"http://arxiv.org/abs/{title}")
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """
+    Serves the responses queued on the server, then a feed of server.total_results entries
+    paged by the request's start and max_results parameters.
+    """
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        self.server.requests.append((time.monotonic(), query))
+
+        if self.server.statuses:
+            status, body = self.server.statuses.pop(0), b"unavailable"
+        else:
+            start, count = int(query["start"][0]), int(query["max_results"][0])
+            ids = range(start, min(start + count, self.server.total_results))
+            status = 200
+            body = atom_feed([(f"id{i}", f"Paper {i}", 2020, ["Ann"], ["cs.DL"]) for i in ids],
+                             self.server.total_results)
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ParseFeedTest(unittest.TestCase):
+
+    def test_fields_are_extracted(self):
+        feed = atom_feed([("http://arxiv.org/abs/1", "  A long\n   title ", 2021, ["Ann", "Bob"], ["cs.LG", "stat.ML"]),
+                          ("http://arxiv.org/abs/2", "Other", 2019, ["Cy"], [])], total_results=7)
+
+        publications, total_results = ArxivClient._parse_feed(feed)
+
+        self.assertEqual(total_results, 7)
+        self.assertEqual(publications, [
+            Publication("A long title", ["Ann", "Bob"], 2021, ["cs.LG", "stat.ML"], "http://arxiv.org/abs/1"),
+            Publication("Other", ["Cy"], 2019, [], "http://arxiv.org/abs/2"),
+        ])
+
+    def test_empty_feed(self):
+        self.assertEqual(ArxivClient._parse_feed(atom_feed([], total_results=0)), ([], 0))
+
+
+class BatchSearchTest(unittest.TestCase):
+
+    # Publications returned by the stubbed _iter_publications for each queried name.
+    DATABASE = {
+        "Ann": [publication("a1", 2024, "Ann"), publication("a2", 2023, "Ann"), publication("a3", 2022, "Ann")],
+        "Bob": [publication("b1", 2021, "Bob"), publication("b2", 2020, "Bob")],
+        "Y. Bengio": [publication("y1", 2018, "Yoshua Bengio")],
+    }
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.client = ArxivClient(cache_path=os.path.join(tmp.name, "publications"))
+        self.queries = []
+        patcher = mock.patch.object(ArxivClient, "_iter_publications", self.iter_publications)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def iter_publications(self, author_names, max_results):
+        # Mimics an OR query: every author's publications, newest first, cut at max_results.
+        self.queries.append(list(author_names))
+        found = {p.title: p for name in author_names for p in self.DATABASE.get(name, [])}
+        return iter(sorted(found.values(), key=lambda p: -p.year)[:max_results])
+
+    def titles(self, publications):
+        return [p.title for p in publications]
+
+    def test_exact_matches_are_taken_from_one_query(self):
+        result = self.client.search_arxiv_publications_batch(["Ann", "Bob"], max_results=5)
+
+        self.assertEqual(self.queries, [["Ann", "Bob"]])
+        self.assertEqual(self.titles(result["Ann"]), ["a1", "a2", "a3"])
+        self.assertEqual(self.titles(result["Bob"]), ["b1", "b2"])
+
+    def test_truncated_batch_falls_back_for_incomplete_authors(self):
+        result = self.client.search_arxiv_publications_batch(["Ann", "Bob"], max_results=2)
+
+        # The batch limit of 4 is filled by a1-a3 and b1: Ann got a full page, Bob did not.
+        self.assertEqual(self.queries, [["Ann", "Bob"], ["Bob"]])
+        self.assertEqual(self.titles(result["Ann"]), ["a1", "a2"])
+        self.assertEqual(self.titles(result["Bob"]), ["b1", "b2"])
+
+    def test_unmatched_name_falls_back_to_individual_search(self):
+        result = self.client.search_arxiv_publications_batch(["Ann", "Y. Bengio"], max_results=5)
+
+        self.assertEqual(self.queries, [["Ann", "Y. Bengio"], ["Y. Bengio"]])
+        self.assertEqual(self.titles(result["Y. Bengio"]), ["y1"])
+
+    def test_single_author_batch_is_searched_individually(self):
+        self.client.search_arxiv_publications_batch(["Ann"], max_results=5)
+
+        self.assertEqual(self.queries, [["Ann"]])
+        self.assertIn(("Ann", 5), self.client._read_cache([("Ann", 5)]))
+
+    def test_batch_results_are_cached_apart_from_single_searches(self):
+        self.client.search_arxiv_publications_batch(["Ann", "Bob"], max_results=2)
+        searches = [("Ann", 2), ("Bob", 2)]
+
+        self.assertEqual(set(self.client._read_cache(searches, namespace=BATCH_CACHE_NAMESPACE)), {("Ann", 2)})
+        self.assertEqual(set(self.client._read_cache(searches)), {("Bob", 2)})
+
+        self.queries.clear()
+        result = self.client.search_arxiv_publications_batch(["Ann", "Bob"], max_results=2)
+
+        self.assertEqual(self.queries, [])
+        self.assertEqual(self.titles(result["Bob"]), ["b1", "b2"])
+
+    def test_cached_searches_expire(self):
+        self.client.search_arxiv_publications("Ann", 5)
+        self.assertIn(("Ann", 5), self.client._read_cache([("Ann", 5)]))
+
+        with mock.patch("time.time", return_value=time.time() + self.client.cache_max_age + 1):
+            self.assertEqual(self.client._read_cache([("Ann", 5)]), {})
+
+
+class HttpTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+        self.server.requests = []
+        self.server.statuses = []
+        self.server.total_results = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/api/query"
+        patcher = mock.patch.object(arxiv_client, "ARXIV_API_URL", url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def client(self, **kwargs):
+        options = dict(delay_seconds=0.0, max_jitter_seconds=0.0, backoff_factor=0.0, cache_path=None)
+        options.update(kwargs)
+        return ArxivClient(**options)
+
+    def gaps(self):
+        times = [request_time for request_time, _ in self.server.requests]
+        return [later - earlier for earlier, later in zip(times, times[1:])]
+
+    def test_pages_are_requested_as_needed(self):
+        self.server.total_results = 5
+        client = self.client(page_size=2)
+
+        self.assertEqual(len(client.search_arxiv_publications("Ann", 4)), 4)
+        self.assertEqual([(query["start"], query["max_results"]) for _, query in self.server.requests],
+                         [(["0"], ["2"]), (["2"], ["2"])])
+
+    def test_stopping_early_sends_no_further_requests(self):
+        self.server.total_results = 5
+        next(self.client(page_size=2)._iter_publications(["Ann"], 5))
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_retries_wait_for_the_politeness_gate(self):
+        self.server.total_results = 1
+        self.server.statuses = [503, 503]
+
+        publications = self.client(delay_seconds=0.3, num_retries=3).search_arxiv_publications("Ann", 5)
+
+        self.assertEqual([p.title for p in publications], ["Paper 0"])
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertTrue(all(gap >= 0.25 for gap in self.gaps()), self.gaps())
+
+    def test_searches_share_the_politeness_gate(self):
+        self.server.total_results = 1
+        client = self.client(delay_seconds=0.3)
+
+        client.search_arxiv_publications("Ann", 5)
+        client.search_arxiv_publications("Bob", 5)
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertGreaterEqual(self.gaps()[0], 0.25)
+
+    def test_exhausted_retries_raise(self):
+        self.server.statuses = [503, 503, 503]
+
+        with self.assertRaises(requests.HTTPError):
+            self.client(num_retries=1).search_arxiv_publications("Ann", 5)
+
+        self.assertEqual(len(self.server.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+import pickle
+import random
+import unittest
+from collections import deque
+
+import networkx as nx
+
+from arxiv_api.clients.collaboration_index import (CollaborationIndex, bidirectional_bfs, bidirectional_bfs_length,
+                                                   connected_components, disjoint_set_find, disjoint_set_union)
+
+"""
+      |
+  \  ___  /                           _________
+ _  /   \  _    GÉANT                 |  * *  | Co-Funded by
+    | ~ |       Trust & Identity      | *   * | the European
+     \_/        Incubator             |__*_*__| Union
+      =
+"""
+
+
+def random_graph(rng, num_nodes, num_edges):
+    """
+    Draw a random simple undirected graph.
+
+    Parameters:
+        rng (random.Random): Source of randomness.
+        num_nodes (int): Number of nodes.
+        num_edges (int): Number of edge draws; duplicates and self-loops are dropped.
+
+    Returns:
+        tuple: The node names (list) and the distinct edges as (id1, id2) pairs with id1 < id2 (list).
+    """
+    names = [f"Author {node}" for node in range(num_nodes)]
+    edges = set()
+
+    for _ in range(num_edges):
+        u, v = rng.randrange(num_nodes), rng.randrange(num_nodes)
+
+        if u != v:
+            edges.add((min(u, v), max(u, v)))
+
+    return names, sorted(edges)
+
+
+def reference_distances(num_nodes, edges, src):
+    """
+    Compute hop distances from one node with a plain breadth-first search.
+
+    Parameters:
+        num_nodes (int): Number of nodes.
+        edges (list): Undirected edges as pairs of node ids.
+        src (int): Id of the start node.
+
+    Returns:
+        dict: Distance per reachable node id.
+    """
+    adj = [[] for _ in range(num_nodes)]
+
+    for u, v in edges:
+        adj[u].append(v)
+        adj[v].append(u)
+
+    dist = {src: 0}
+    queue = deque([src])
+
+    while queue:
+        node = queue.popleft()
+
+        for neighbor in adj[node]:
+            if neighbor not in dist:
+                dist[neighbor] = dist[node] + 1
+                queue.append(neighbor)
+
+    return dist
+
+
+class CollaborationIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def graphs(self, count=300):
+        for _ in range(count):
+            num_nodes = self.rng.randint(1, 30)
+            yield random_graph(self.rng, num_nodes, self.rng.randint(0, 2 * num_nodes))
+
+    def assertValidPath(self, path, edges, src, dst, length):
+        edge_set = set(edges) | {(v, u) for u, v in edges}
+        self.assertEqual(path[0], src)
+        self.assertEqual(path[-1], dst)
+        self.assertEqual(len(path), length + 1)
+        self.assertTrue(all(step in edge_set for step in zip(path, path[1:])))
+
+    def test_kernels_match_reference_bfs(self):
+        for names, edges in self.graphs():
+            index = CollaborationIndex.from_edges(names, edges)
+
+            for src in range(len(names)):
+                dist = reference_distances(len(names), edges, src)
+
+                for dst in range(len(names)):
+                    path = bidirectional_bfs(index.indptr, index.indices, index.degree, src, dst)
+                    length = bidirectional_bfs_length(index.indptr, index.indices, index.degree, src, dst)
+
+                    if dst in dist:
+                        self.assertEqual(length, dist[dst])
+                        self.assertValidPath(path, edges, src, dst, dist[dst])
+                    else:
+                        self.assertIsNone(path)
+                        self.assertIsNone(length)
+
+    def test_shortest_path_by_name(self):
+        for names, edges in self.graphs(100):
+            index = CollaborationIndex.from_edges(names, edges)
+            name_edges = [(names[u], names[v]) for u, v in edges]
+
+            for _ in range(20):
+                src, dst = self.rng.randrange(len(names)), self.rng.randrange(len(names))
+                dist = reference_distances(len(names), edges, src)
+                path = index.shortest_path(names[src], names[dst])
+
+                if dst in dist:
+                    self.assertEqual(index.shortest_path_length(names[src], names[dst]), dist[dst])
+                    self.assertValidPath(path, name_edges, names[src], names[dst], dist[dst])
+                else:
+                    self.assertIsNone(path)
+                    self.assertIsNone(index.shortest_path_length(names[src], names[dst]))
+
+    def test_components_match_union_find(self):
+        for names, edges in self.graphs():
+            index = CollaborationIndex.from_edges(names, edges)
+            parent = list(range(len(names)))
+
+            for u, v in edges:
+                disjoint_set_union(parent, u, v)
+
+            labels = connected_components(index.indptr, index.indices)
+            roots = [disjoint_set_find(parent, node) for node in range(len(names))]
+
+            for src in range(len(names)):
+                dist = reference_distances(len(names), edges, src)
+
+                for dst in range(len(names)):
+                    self.assertEqual(labels[src] == labels[dst], dst in dist)
+                    self.assertEqual(roots[src] == roots[dst], dst in dist)
+
+    def test_unconnected_authors_are_rejected_without_search(self):
+        index = CollaborationIndex.from_edges(["A", "B", "C", "D"], [(0, 1), (2, 3)])
+
+        self.assertIsNone(index.shortest_path("A", "C"))
+        self.assertIsNone(index.shortest_path_length("D", "B"))
+        self.assertEqual(index._cached_path.cache_info().currsize, 0)
+
+    def test_path_cache_is_shared_by_both_directions(self):
+        index = CollaborationIndex.from_edges(["A", "B", "C", "D"], [(0, 1), (1, 2), (2, 3)])
+
+        self.assertEqual(index.shortest_path("D", "A"), ["D", "C", "B", "A"])
+        self.assertEqual(index.shortest_path("A", "D"), ["A", "B", "C", "D"])
+
+        info = index._cached_path.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_path_cache_is_bounded(self):
+        names = [f"Author {node}" for node in range(10)]
+        chain = CollaborationIndex.from_edges(names, [(node, node + 1) for node in range(9)])
+        index = CollaborationIndex(chain.names, chain.indptr, chain.indices, path_cache_size=3)
+
+        for node in range(1, 10):
+            index.shortest_path(names[0], names[node])
+
+        self.assertEqual(index._cached_path.cache_info().currsize, 3)
+
+    def test_from_edges_matches_from_graph(self):
+        for names, edges in self.graphs(50):
+            G = nx.Graph()
+            G.add_nodes_from(names)
+            G.add_edges_from((names[u], names[v]) for u, v in edges)
+            from_graph = CollaborationIndex.from_graph(G)
+            from_edges = CollaborationIndex.from_edges(names, edges)
+
+            self.assertEqual(from_graph.number_of_nodes(), from_edges.number_of_nodes())
+            self.assertEqual(from_graph.number_of_edges(), from_edges.number_of_edges())
+
+            for src in names:
+                for dst in names:
+                    self.assertEqual(from_graph.shortest_path_length(src, dst),
+                                     from_edges.shortest_path_length(src, dst))
+
+    def test_self_loops_are_counted_alike(self):
+        G = nx.Graph([("A", "A"), ("A", "B"), ("B", "C")])
+        from_graph = CollaborationIndex.from_graph(G)
+        from_edges = CollaborationIndex.from_edges(["A", "B", "C"], [(0, 0), (0, 1), (1, 2)])
+
+        self.assertEqual(from_graph.number_of_edges(), G.number_of_edges())
+        self.assertEqual(from_edges.number_of_edges(), G.number_of_edges())
+        self.assertEqual(list(from_graph.degree), [degree for _, degree in G.degree])
+        self.assertEqual(from_graph.shortest_path("A", "C"), ["A", "B", "C"])
+
+    def test_pickle_round_trip(self):
+        index = CollaborationIndex.from_edges(["A", "B", "C"], [(0, 1), (1, 2)])
+        index.shortest_path("A", "C")
+
+        restored = pickle.loads(pickle.dumps(index))
+
+        self.assertEqual(restored.degree, index.degree)
+        self.assertEqual(restored._cached_path.cache_info().currsize, 0)
+        self.assertEqual(restored.shortest_path("C", "A"), ["C", "B", "A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
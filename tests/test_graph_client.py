@@ -0,0 +1,236 @@
+import contextlib
+import gzip
+import io
+import os
+import pickle
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import networkx as nx
+
+from arxiv_api.clients.graph_client import GraphClient
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+"""
+      |
+  \  ___  /                           _________
+ _  /   \  _    GÉANT                 |  * *  | Co-Funded by
+    | ~ |       Trust & Identity      | *   * | the European
+     \_/        Incubator             |__*_*__| Union
+      =
+"""
+
+
+class LoadCollaborationIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_folder = tmp.name
+        self.cache_path = os.path.join(self.csv_folder, "_index.pkl")
+
+    def write_csv(self, filename, rows, age=0):
+        filepath = os.path.join(self.csv_folder, filename)
+
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            f.write("Author1,Author2\n")
+            f.writelines(f"{a},{b}\n" for a, b in rows)
+
+        # Back-date the file so the cache written next is clearly newer, whatever the
+        # filesystem's timestamp resolution.
+        mtime = time.time() - age
+        os.utime(filepath, (mtime, mtime))
+
+    def load(self, use_cache=True):
+        # Returns the index and whether it was built from the CSV files rather than read from the cache.
+        with mock.patch.object(GraphClient, "_collect_csv_edges", wraps=GraphClient._collect_csv_edges) as collect, \
+                contextlib.redirect_stdout(io.StringIO()):
+            index = GraphClient.load_collaboration_index(self.csv_folder, processes=1, use_cache=use_cache)
+
+        return index, collect.called
+
+    def test_cache_is_reused_while_files_are_unchanged(self):
+        self.write_csv("a.csv", [("Ann", "Bob"), ("Bob", "Cy")], age=60)
+
+        index, rebuilt = self.load()
+        self.assertTrue(rebuilt)
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        index, rebuilt = self.load()
+        self.assertFalse(rebuilt)
+        self.assertEqual(index.shortest_path("Ann", "Cy"), ["Ann", "Bob", "Cy"])
+
+    def test_new_file_invalidates_cache(self):
+        self.write_csv("a.csv", [("Ann", "Bob")], age=60)
+        self.load()
+
+        self.write_csv("b.csv", [("Bob", "Cy")], age=60)
+        index, rebuilt = self.load()
+
+        self.assertTrue(rebuilt)
+        self.assertEqual(index.shortest_path_length("Ann", "Cy"), 2)
+
+    def test_removed_file_invalidates_cache(self):
+        self.write_csv("a.csv", [("Ann", "Bob")], age=60)
+        self.write_csv("b.csv", [("Bob", "Cy")], age=60)
+        self.load()
+
+        os.remove(os.path.join(self.csv_folder, "b.csv"))
+        index, rebuilt = self.load()
+
+        self.assertTrue(rebuilt)
+        self.assertFalse(index.has_node("Cy"))
+
+    def test_modified_file_invalidates_cache(self):
+        self.write_csv("a.csv", [("Ann", "Bob")], age=60)
+        self.load()
+
+        self.write_csv("a.csv", [("Ann", "Bob"), ("Bob", "Cy")], age=-60)
+        index, rebuilt = self.load()
+
+        self.assertTrue(rebuilt)
+        self.assertEqual(index.shortest_path("Cy", "Ann"), ["Cy", "Bob", "Ann"])
+
+    def test_use_cache_false_ignores_and_keeps_cache(self):
+        self.write_csv("a.csv", [("Ann", "Bob")], age=60)
+        self.load()
+        cache_mtime = os.path.getmtime(self.cache_path)
+
+        index, rebuilt = self.load(use_cache=False)
+
+        self.assertTrue(rebuilt)
+        self.assertEqual(index.number_of_edges(), 1)
+        self.assertEqual(os.path.getmtime(self.cache_path), cache_mtime)
+
+
+    def test_truncated_cache_is_rebuilt(self):
+        self.write_csv("a.csv", [("Ann", "Bob")], age=60)
+        self.load()
+
+        with open(self.cache_path, "rb") as f:
+            data = f.read()
+
+        with open(self.cache_path, "wb") as f:
+            f.write(data[:len(data) // 2])
+
+        index, rebuilt = self.load()
+        self.assertTrue(rebuilt)
+        self.assertEqual(index.shortest_path("Ann", "Bob"), ["Ann", "Bob"])
+
+        index, rebuilt = self.load()
+        self.assertFalse(rebuilt)
+
+    def test_interrupted_cache_write_keeps_previous_cache(self):
+        self.write_csv("a.csv", [("Ann", "Bob")], age=60)
+        self.load()
+
+        with mock.patch.object(pickle, "dump", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                GraphClient._write_cache(self.cache_path, ["a.csv"], None)
+
+        self.assertEqual(sorted(os.listdir(self.csv_folder)), ["_index.pkl", "a.csv"])
+        index, rebuilt = self.load()
+        self.assertFalse(rebuilt)
+        self.assertTrue(index.has_node("Ann"))
+
+
+class CsvParsingTest(unittest.TestCase):
+
+    # Short, empty-field and blank rows are skipped on both parsing paths.
+    LINES = ["Ann,Bob", "Ann,", ",Bob", "", "Cy", "Bob,Dee"]
+    EDGES = [("Ann", "Bob"), ("Bob", "Dee")]
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_folder = tmp.name
+
+    def write(self, filename, lines, opener=open):
+        filepath = os.path.join(self.csv_folder, filename)
+
+        with opener(filepath, "wt", newline="", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+
+        return filepath
+
+    def test_fast_path(self):
+        filepath = self.write("a.csv", ["Author1,Author2"] + self.LINES)
+
+        with mock.patch.object(GraphClient, "_read_csv_edges_with_csv_module") as fallback:
+            self.assertEqual(GraphClient._read_csv_edges(filepath), self.EDGES)
+
+        fallback.assert_not_called()
+
+    def test_quoted_field_uses_csv_module_with_same_rules(self):
+        filepath = self.write("a.csv", ["Author1,Author2"] + self.LINES + ['"Doe, Jane",Ann'])
+
+        self.assertEqual(GraphClient._read_csv_edges(filepath), self.EDGES + [("Doe, Jane", "Ann")])
+
+    def test_extra_columns_are_ignored(self):
+        filepath = self.write("a.csv", ["Author1,Author2,Year"] + self.LINES + ["Eve,Fay,2020"])
+
+        self.assertEqual(GraphClient._read_csv_edges(filepath), self.EDGES + [("Eve", "Fay")])
+
+    def test_empty_file(self):
+        filepath = self.write("a.csv", [])
+
+        self.assertEqual(GraphClient._read_csv_edges(filepath), [])
+        self.assertEqual(GraphClient._read_csv_edges_with_csv_module(filepath), [])
+
+    def test_empty_file_among_several(self):
+        filepaths = [self.write("a.csv", []), self.write("b.csv", ["Author1,Author2", "Ann,Bob"])]
+
+        for paths in (filepaths[:1], filepaths):
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                names, edges, _ = GraphClient._collect_csv_edges([os.path.basename(p) for p in paths], paths, 2)
+
+            self.assertIn("Loading edges from a.csv...", output.getvalue())
+            self.assertEqual(len(edges), len(paths) - 1)
+
+    def test_gzip(self):
+        filepath = self.write("a.csv.gz", ["Author1,Author2"] + self.LINES, opener=gzip.open)
+
+        self.assertEqual(GraphClient._read_csv_edges(filepath), self.EDGES)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstandard(self):
+        filepath = self.write("a.csv.zst", ["Author1,Author2"] + self.LINES, opener=zstandard.open)
+
+        self.assertEqual(GraphClient._read_csv_edges(filepath), self.EDGES)
+
+
+class FindConnectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.G = nx.Graph([("Ann", "Bob"), ("Bob", "Cy"), ("Dee", "Eve")])
+
+    def run_query(self, query, G, author1, author2):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            result = query(G, author1, author2)
+
+        return result, output.getvalue()
+
+    def test_graph_and_index_give_the_same_answers(self):
+        index = GraphClient.build_collaboration_index(self.G)
+
+        for query in (GraphClient.find_connection, GraphClient.connection_distance):
+            for author1, author2 in (("Ann", "Cy"), ("Cy", "Ann"), ("Ann", "Eve"), ("Ann", "Zoe")):
+                self.assertEqual(self.run_query(query, self.G, author1, author2),
+                                 self.run_query(query, index, author1, author2))
+
+    def test_graph_is_not_converted(self):
+        with mock.patch.object(GraphClient, "build_collaboration_index") as build:
+            result, output = self.run_query(GraphClient.connection_distance, self.G, "Ann", "Cy")
+
+        build.assert_not_called()
+        self.assertEqual(result, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()